@@ -7,13 +7,17 @@ extraction) before delegating to the package functions.
 
 from typing import Any
 
-from db_init import _init_db
+from tracekit.calendar import get_calendar_shell as _get_calendar_shell
+from tracekit.calendar import get_months_data as _get_months_data
+from tracekit.calendar import get_single_month_data as _get_single_month_data
+from tracekit.db import get_db
 
 
 def _sort_providers_by_priority(providers: list[str], config: dict[str, Any] | None) -> list[str]:
     """Sort a list of provider names by their configured priority (lowest = first)."""
     pconf = (config or {}).get("providers", {})
-    return sorted(providers, key=lambda p: (pconf.get(p, {}).get("priority", 999), p))
+    priority = {p: pconf.get(p, {}).get("priority", 999) for p in providers}
+    return sorted(providers, key=lambda p: (priority[p], p))
 
 
 def get_sync_calendar_data(config: dict[str, Any]) -> dict[str, Any]:
@@ -27,9 +31,10 @@ def get_sync_calendar_data(config: dict[str, Any]) -> dict[str, Any]:
     if shell.get("error"):
         return shell
 
+    months_data = get_months_data(config, [stub["year_month"] for stub in shell["months"]])
     months_with_data = []
     for stub in shell["months"]:
-        month_data = get_single_month_data(config, stub["year_month"])
+        month_data = months_data[stub["year_month"]]
         if month_data.get("error"):
             months_with_data.append(stub)
         else:
@@ -45,15 +50,8 @@ def get_sync_calendar_data(config: dict[str, Any]) -> dict[str, Any]:
 
 def get_calendar_shell(config: dict[str, Any] | None = None) -> dict[str, Any]:
     """Return month stubs and providers list — no activity table scans."""
-    if not _init_db():
-        return {"error": "Database not available"}
-
     try:
-        from tracekit.calendar import get_calendar_shell as _get_calendar_shell
-        from tracekit.db import get_db
-
-        db = get_db()
-        db.connect(reuse_if_open=True)
+        get_db()  # raises if the DB is not configured
 
         tz_str = (config or {}).get("home_timezone", "UTC")
         result = _get_calendar_shell(tz_str)
@@ -66,15 +64,8 @@ def get_calendar_shell(config: dict[str, Any] | None = None) -> dict[str, Any]:
 
 def get_single_month_data(config: dict[str, Any] | None, year_month: str) -> dict[str, Any]:
     """Return sync status and activity counts for one month."""
-    if not _init_db():
-        return {"error": "Database not available"}
-
     try:
-        from tracekit.calendar import get_single_month_data as _get_single_month_data
-        from tracekit.db import get_db
-
-        db = get_db()
-        db.connect(reuse_if_open=True)
+        get_db()  # raises if the DB is not configured
 
         tz_str = (config or {}).get("home_timezone", "UTC")
         result = _get_single_month_data(year_month, tz_str)
@@ -83,3 +74,17 @@ def get_single_month_data(config: dict[str, Any] | None, year_month: str) -> dic
         return result
     except Exception as e:
         return {"error": f"Database error: {e}"}
+
+
+def get_months_data(config: dict[str, Any] | None, year_months: list[str]) -> dict[str, dict[str, Any]]:
+    """Return {year_month: month data} for several months using shared queries."""
+    try:
+        get_db()  # raises if the DB is not configured
+
+        tz_str = (config or {}).get("home_timezone", "UTC")
+        result = _get_months_data(year_months, tz_str)
+        for month_data in result.values():
+            month_data["providers"] = _sort_providers_by_priority(month_data["providers"], config)
+        return result
+    except Exception as e:
+        return {ym: {"error": f"Database error: {e}"} for ym in year_months}
@@ -1,8 +1,14 @@
 """Database initialisation and config loading for the tracekit web app."""
 
+import threading
 from typing import Any
 
+from tracekit.appconfig import get_db_path_from_env, load_config
+from tracekit.database import get_all_models, migrate_tables
+from tracekit.db import configure_db, get_db
+
 _db_initialized = False
+_init_lock = threading.Lock()
 
 
 def _init_db() -> bool:
@@ -19,22 +25,23 @@ def _init_db() -> bool:
     global _db_initialized
     if _db_initialized:
         return True
-    try:
-        from tracekit.appconfig import get_db_path_from_env
-        from tracekit.database import get_all_models, migrate_tables
-        from tracekit.db import configure_db
-
-        configure_db(get_db_path_from_env())
-        migrate_tables(get_all_models())
-
-        from models.user import User
-
-        migrate_tables([User])
-
-        _db_initialized = True
-    except Exception as e:
-        print(f"DB init failed: {e}")
-        return False
+    # Double-checked so concurrent first requests under the threaded dev
+    # server cannot run configure/migrate twice.
+    with _init_lock:
+        if _db_initialized:
+            return True
+        try:
+            configure_db(get_db_path_from_env())
+            migrate_tables(get_all_models())
+
+            from models.user import User
+
+            migrate_tables([User])
+
+            _db_initialized = True
+        except Exception as e:
+            print(f"DB init failed: {e}")
+            return False
     return True
 
 
@@ -48,8 +55,6 @@ def _ensure_db_connected() -> bool:
     if not _db_initialized:
         return _init_db()
     try:
-        from tracekit.db import get_db
-
         get_db().connect(reuse_if_open=True)
     except Exception as e:
         print(f"DB connect failed: {e}")
@@ -64,6 +69,4 @@ def load_tracekit_config() -> dict[str, Any]:
     Never returns an error dict; the app always has a working config.
     """
     _init_db()
-    from tracekit.appconfig import load_config
-
     return load_config()
@@ -23,6 +23,15 @@ def on_starting(server):
 
     _init_db()
 
+    # Drop the pooled connections the migrations opened so no socket is
+    # inherited by (and shared between) the forked workers.
+    try:
+        from tracekit.db import get_db
+
+        get_db().close_all()
+    except Exception:
+        pass
+
 
 def post_fork(server, worker):
     """Close the master-process DB connection so each worker opens its own."""
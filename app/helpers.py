@@ -3,31 +3,41 @@
 from datetime import datetime
 from typing import Any
 
-import pytz
-from db_init import _init_db
+from flask import Response, jsonify, request
+
+from tracekit.db import get_db
+from tracekit.stats import get_database_info as _get_database_info
+from tracekit.stats import get_gear_fix_months as _get_fix_months
+from tracekit.stats import get_gear_summary as _get_gear_summary
+from tracekit.stats import get_most_recent_activity as _get_most_recent
+from tracekit.stats import get_oldest_activity_month as _get_oldest
+from tracekit.stats import get_provider_activity_counts as _get_counts
+from tracekit.utils import get_timezone
+from tracekit.utils import sort_providers as _sort_providers
 
 
 def get_current_date_in_timezone(config: dict[str, Any]):
     """Get the current date in the configured timezone."""
-    try:
-        timezone_str = config.get("home_timezone", "UTC")
-        tz = pytz.timezone(timezone_str)
-        now = datetime.now(tz)
-        return now.date()
-    except Exception:
-        return datetime.now(pytz.UTC).date()
+    return datetime.now(get_timezone(config.get("home_timezone", "UTC"))).date()
+
+
+def conditional_json(payload: Any) -> Response:
+    """Return *payload* as JSON tagged with a content ETag.
+
+    Clients that already hold the same body (``If-None-Match``) get an empty
+    304 instead.  ``no-cache`` makes browsers revalidate on every fetch, so
+    fresh data is never masked — only the unchanged payload is skipped.
+    """
+    response = jsonify(payload)
+    response.headers["Cache-Control"] = "private, no-cache"
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 def get_database_info(config: dict[str, Any] | None = None) -> dict[str, Any]:
     """Get basic information about the configured database."""
-    if not _init_db():
-        return {"error": "Database not available"}
     try:
-        from tracekit.db import get_db
-        from tracekit.stats import get_database_info as _get_database_info
-
-        db = get_db()
-        db.connect(reuse_if_open=True)
+        get_db()  # raises if the DB is not configured
         return _get_database_info()
     except Exception as e:
         return {"error": f"Database error: {e}"}
@@ -35,14 +45,8 @@ def get_database_info(config: dict[str, Any] | None = None) -> dict[str, Any]:
 
 def get_most_recent_activity(config: dict[str, Any] | None = None) -> dict[str, Any]:
     """Return the timestamp and timezone-formatted datetime of the most recent activity."""
-    if not _init_db():
-        return {"error": "Database not available"}
     try:
-        from tracekit.db import get_db
-        from tracekit.stats import get_most_recent_activity as _get_most_recent
-
-        db = get_db()
-        db.connect(reuse_if_open=True)
+        get_db()  # raises if the DB is not configured
         tz_str = (config or {}).get("home_timezone", "UTC")
         return _get_most_recent(tz_str)
     except Exception as e:
@@ -51,14 +55,8 @@ def get_most_recent_activity(config: dict[str, Any] | None = None) -> dict[str,
 
 def get_provider_activity_counts() -> dict[str, int]:
     """Return {provider_name: activity_count} for all known providers."""
-    if not _init_db():
-        return {}
     try:
-        from tracekit.db import get_db
-        from tracekit.stats import get_provider_activity_counts as _get_counts
-
-        db = get_db()
-        db.connect(reuse_if_open=True)
+        get_db()  # raises if the DB is not configured
         return _get_counts()
     except Exception as e:
         return {"error": f"Database error: {e}"}  # type: ignore[return-value]
@@ -66,14 +64,8 @@ def get_provider_activity_counts() -> dict[str, int]:
 
 def get_oldest_activity_month() -> str | None:
     """Return the earliest month with any activity as 'YYYY-MM', or None."""
-    if not _init_db():
-        return None
     try:
-        from tracekit.db import get_db
-        from tracekit.stats import get_oldest_activity_month as _get_oldest
-
-        db = get_db()
-        db.connect(reuse_if_open=True)
+        get_db()  # raises if the DB is not configured
         return _get_oldest()
     except Exception:
         return None
@@ -81,14 +73,8 @@ def get_oldest_activity_month() -> str | None:
 
 def get_gear_summary(home_timezone: str = "UTC") -> list[dict]:
     """Return per-gear mileage summary rows, sorted by most-recently used."""
-    if not _init_db():
-        return []
     try:
-        from tracekit.db import get_db
-        from tracekit.stats import get_gear_summary as _get_gear_summary
-
-        db = get_db()
-        db.connect(reuse_if_open=True)
+        get_db()  # raises if the DB is not configured
         return _get_gear_summary(home_timezone)
     except Exception:
         return []
@@ -96,14 +82,8 @@ def get_gear_summary(home_timezone: str = "UTC") -> list[dict]:
 
 def get_gear_fix_months(gear_rows: list[dict], ordered_providers: list[str]) -> dict[str, dict[str, str]]:
     """Return {gear_name: {provider_name: "YYYY-MM"}} for yellow (diff) cells."""
-    if not _init_db():
-        return {}
     try:
-        from tracekit.db import get_db
-        from tracekit.stats import get_gear_fix_months as _get_fix_months
-
-        db = get_db()
-        db.connect(reuse_if_open=True)
+        get_db()  # raises if the DB is not configured
         return _get_fix_months(gear_rows, ordered_providers)
     except Exception:
         return {}
@@ -111,6 +91,4 @@ def get_gear_fix_months(gear_rows: list[dict], ordered_providers: list[str]) ->
 
 def sort_providers(providers: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
     """Sort providers by priority (lowest first) with disabled providers at the end."""
-    from tracekit.utils import sort_providers as _sort_providers
-
     return _sort_providers(providers)
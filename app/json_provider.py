@@ -0,0 +1,39 @@
+"""orjson-backed JSON provider for the tracekit web app.
+
+orjson ships with the ``[production]`` extra; without it the app keeps
+Flask's stdlib-based provider.  Keys are sorted and datetimes go through
+``default`` as HTTP dates, like the default provider, but the output is not
+byte-identical: non-ASCII text is written as UTF-8 rather than ``\\uXXXX``
+escapes (orjson ignores ``ensure_ascii``), and NaN/Infinity become ``null``
+instead of the non-standard ``NaN``/``Infinity`` tokens.
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra is absent
+    orjson = None
+
+_COMPACT = {"separators": (",", ":")}
+_PRETTY = {"indent": 2}
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialise with orjson, deferring to the stdlib for anything unusual."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs == _COMPACT or not kwargs:
+            option = 0
+        elif kwargs == _PRETTY:
+            option = orjson.OPT_INDENT_2
+        else:
+            return super().dumps(obj, **kwargs)
+        option |= orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib handles
+            return super().dumps(obj, **kwargs)
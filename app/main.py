@@ -9,6 +9,10 @@ from pathlib import Path
 from db_init import _ensure_db_connected, load_tracekit_config
 from flask import Flask, abort, redirect, request, url_for
 from flask_login import LoginManager, current_user
+from json_provider import ORJSONProvider, orjson
+
+from tracekit.db import db
+from tracekit.user_context import get_user_id, set_user_id
 
 logging.basicConfig(
     level=logging.INFO,
@@ -50,6 +54,8 @@ app = Flask(
 )
 
 app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 900  # 15 minutes
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 app.secret_key = os.environ["SESSION_KEY"]
 
 login_manager = LoginManager()
@@ -86,14 +92,9 @@ _PUBLIC_ENDPOINTS = frozenset(
 @app.before_request
 def _setup_request():
     """Connect DB, set tracekit user context, enforce authentication."""
-    from tracekit.user_context import set_user_id
-
     # Connect DB for all endpoints that may need it (skip health + static)
-    if request.endpoint not in {"api.health", "static"}:
-        try:
-            _ensure_db_connected()
-        except Exception:
-            abort(503)
+    if request.endpoint not in {"api.health", "static"} and not _ensure_db_connected():
+        abort(503)
 
     # Set tracekit user context (accessing current_user triggers user_loader)
     uid = current_user.id if current_user.is_authenticated else 0
@@ -109,6 +110,13 @@ def _setup_request():
         return redirect(url_for("auth.login"))
 
 
+@app.teardown_request
+def _close_db(exc):
+    """Return the request's DB connection to the pool."""
+    if db.obj is not None and not db.is_closed():
+        db.close()
+
+
 @app.context_processor
 def inject_sentry():
     return {
@@ -121,8 +129,6 @@ def inject_sentry():
 @app.after_request
 def _log_request(response):
     if request.path != "/health":
-        from tracekit.user_context import get_user_id
-
         log_record = {
             "method": request.method,
             "path": request.path,
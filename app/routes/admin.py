@@ -2,8 +2,19 @@
 
 import json
 
-from flask import Blueprint, abort, jsonify, redirect, render_template, session, url_for
+from flask import Blueprint, abort, jsonify, redirect, render_template, request, session, url_for
 from flask_login import current_user, login_user
+from models.user import User
+
+from tracekit.appconfig import (
+    ALL_PROVIDERS,
+    AppConfig,
+    get_strava_webhook_config,
+    get_system_providers,
+    save_system_providers,
+)
+from tracekit.providers.activities import PROVIDER_ACTIVITY_MODELS
+from tracekit.stats import get_activity_counts_by_user
 
 admin_bp = Blueprint("admin", __name__)
 
@@ -17,8 +28,6 @@ def _require_admin():
 def _get_user_providers(user_id: int) -> dict:
     """Return {provider_name: enabled} for a given user from their AppConfig."""
     try:
-        from tracekit.appconfig import AppConfig
-
         row = AppConfig.get_or_none((AppConfig.key == "providers") & (AppConfig.user_id == user_id))
         if row:
             return {name: cfg.get("enabled", False) for name, cfg in json.loads(row.value).items()}
@@ -27,31 +36,14 @@ def _get_user_providers(user_id: int) -> dict:
     return {}
 
 
-def _get_user_activity_counts(user_id: int) -> dict:
-    """Return {provider_name: count} for a given user across all provider tables."""
+def _get_user_activity_counts(user_ids: list[int]) -> dict[int, dict]:
+    """Return {user_id: {provider_name: count}} for the given users across all provider tables."""
     try:
-        from tracekit.providers.file.file_activity import FileActivity
-        from tracekit.providers.garmin.garmin_activity import GarminActivity
-        from tracekit.providers.intervalsicu.intervalsicu_activity import (
-            IntervalsICUActivity,
-        )
-        from tracekit.providers.ridewithgps.ridewithgps_activity import (
-            RideWithGPSActivity,
-        )
-        from tracekit.providers.spreadsheet.spreadsheet_activity import (
-            SpreadsheetActivity,
-        )
-        from tracekit.providers.strava.strava_activity import StravaActivity
-
-        models = {
-            "strava": StravaActivity,
-            "garmin": GarminActivity,
-            "ridewithgps": RideWithGPSActivity,
-            "intervalsicu": IntervalsICUActivity,
-            "spreadsheet": SpreadsheetActivity,
-            "file": FileActivity,
+        by_user = get_activity_counts_by_user()
+        return {
+            user_id: {name: by_user.get(user_id, {}).get(name, 0) for name in PROVIDER_ACTIVITY_MODELS}
+            for user_id in user_ids
         }
-        return {name: model.select().where(model.user_id == user_id).count() for name, model in models.items()}
     except Exception:
         return {}
 
@@ -61,13 +53,12 @@ def index():
     """Admin dashboard — list all users."""
     _require_admin()
 
-    from models.user import User
-
     users = list(User.select().order_by(User.id))
+    all_counts = _get_user_activity_counts([u.id for u in users])
     user_data = []
     for u in users:
         providers = _get_user_providers(u.id)
-        counts = _get_user_activity_counts(u.id)
+        counts = all_counts.get(u.id, {})
         # Merge: only show providers that are enabled or have activities
         provider_info = {}
         for name in set(list(providers.keys()) + list(counts.keys())):
@@ -87,10 +78,6 @@ def index():
             }
         )
 
-    from flask import request
-
-    from tracekit.appconfig import get_strava_webhook_config, get_system_providers
-
     system_providers = get_system_providers()
     strava_webhook_cfg = get_strava_webhook_config()
 
@@ -114,12 +101,6 @@ def toggle_provider(provider: str):
     """Toggle global visibility of a provider. Returns JSON."""
     _require_admin()
 
-    from tracekit.appconfig import (
-        ALL_PROVIDERS,
-        get_system_providers,
-        save_system_providers,
-    )
-
     if provider not in ALL_PROVIDERS:
         return jsonify({"error": "Unknown provider"}), 400
 
@@ -141,8 +122,6 @@ def toggle_user(user_id: int):
     """Toggle a user's status between active and blocked. Returns JSON."""
     _require_admin()
 
-    from models.user import User
-
     try:
         user = User.get_by_id(user_id)
     except User.DoesNotExist:
@@ -161,8 +140,6 @@ def impersonate_user(user_id: int):
     """Begin impersonating a user. Stores admin's ID in session and switches login."""
     _require_admin()
 
-    from models.user import User
-
     try:
         target = User.get_by_id(user_id)
     except User.DoesNotExist:
@@ -183,8 +160,6 @@ def end_impersonation():
     if not session.get("is_impersonating"):
         abort(400)
 
-    from models.user import User
-
     original_id = session.pop("original_user_id", None)
     session.pop("is_impersonating", None)
 
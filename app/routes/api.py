@@ -1,21 +1,28 @@
 """General API routes (config, database, health) for the tracekit web app."""
 
 from db_init import _init_db, load_tracekit_config
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from flask_login import current_user
 from helpers import (
+    conditional_json,
     get_database_info,
     get_most_recent_activity,
     get_provider_activity_counts,
 )
 
+from tracekit.appconfig import save_config
+from tracekit.provider_status import get_all_statuses
+
 api_bp = Blueprint("api", __name__)
 
+# /health is polled by container health checks; its body never changes.
+_HEALTH_BODY = b'{"app":"tracekit-web","status":"healthy"}\n'
+
 
 @api_bp.route("/api/config", methods=["GET"])
 def api_config():
     """Return the current configuration as JSON."""
-    return jsonify(load_tracekit_config())
+    return conditional_json(load_tracekit_config())
 
 
 @api_bp.route("/api/config", methods=["PUT"])
@@ -25,8 +32,6 @@ def api_config_save():
     if not data or not isinstance(data, dict):
         return jsonify({"error": "Expected a JSON object"}), 400
     _init_db()
-    from tracekit.appconfig import save_config
-
     save_config(data)
     return jsonify({"status": "saved"})
 
@@ -34,7 +39,7 @@ def api_config_save():
 @api_bp.route("/api/database")
 def api_database():
     """API endpoint for database information."""
-    return jsonify(get_database_info())
+    return conditional_json(get_database_info())
 
 
 @api_bp.route("/api/recent-activity")
@@ -48,8 +53,6 @@ def api_recent_activity():
 def api_provider_status():
     """Return per-provider operational status (last op, success, rate limits)."""
     try:
-        from tracekit.provider_status import get_all_statuses
-
         statuses = get_all_statuses()
         counts = get_provider_activity_counts()
 
@@ -81,4 +84,4 @@ def set_allow_impersonation():
 @api_bp.route("/health")
 def health():
     """Health check endpoint."""
-    return jsonify({"status": "healthy", "app": "tracekit-web"})
+    return Response(_HEALTH_BODY, mimetype="application/json")
@@ -15,10 +15,15 @@ _GARMIN_SESSION_TTL = 600  # 10 minutes
 
 
 def _cleanup_garmin_sessions() -> None:
+    # Every session gets the same TTL, so dict insertion order is expiry
+    # order: drop from the front until the oldest remaining one is still live.
     now = time.time()
-    expired = [k for k, (*_, exp) in _pending_garmin_sessions.items() if now > exp]
-    for k in expired:
-        del _pending_garmin_sessions[k]
+    while _pending_garmin_sessions:
+        session_id = next(iter(_pending_garmin_sessions))
+        entry = _pending_garmin_sessions.get(session_id)
+        if entry is not None and now <= entry[-1]:
+            break
+        _pending_garmin_sessions.pop(session_id, None)
 
 
 def _save_garmin_tokens(email: str, garth_tokens: str) -> None:
@@ -1,5 +1,7 @@
 """Intervals.icu OAuth routes for the tracekit web app."""
 
+import html
+import json
 import os
 
 import requests
@@ -34,7 +36,9 @@ def _icu_callback_page(success: bool, message: str) -> str:
     """Return an HTML page that notifies the opener then closes itself."""
     status = "ok" if success else "error"
     icon = "\u2713" if success else "\u2717"
-    safe_msg = message.replace("'", "\\'").replace("<", "&lt;").replace(">", "&gt;")
+    safe_msg = html.escape(message)
+    # JSON is a valid JS literal; escaping "<" keeps "</script>" out of the inline script.
+    js_msg = json.dumps(message).replace("<", "\\u003c")
     redirect_block = (
         """
   <p id="redirect-msg" style="font-size:0.95rem;color:#666;">
@@ -60,7 +64,7 @@ def _icu_callback_page(success: bool, message: str) -> str:
   <p><a href="/settings" style="font-size:1rem;">Go to Settings</a></p>
   <script>
     if (window.opener) {{
-      window.opener.postMessage({{intervalsicuAuth:true,status:'{status}',message:'{safe_msg}'}}, '*');
+      window.opener.postMessage({{intervalsicuAuth:true,status:'{status}',message:{js_msg}}}, '*');
       window.close();
     }}
   </script>
@@ -2,14 +2,20 @@
 
 import re
 
-from calendar_data import get_single_month_data
+from calendar_data import get_months_data, get_single_month_data
 from db_init import load_tracekit_config
 from flask import Blueprint, jsonify, request
+from helpers import conditional_json
 
 from tracekit.appconfig import ALL_PROVIDERS
+from tracekit.provider_status import PullStatus, is_pull_active, set_pull_status
+from tracekit.provider_sync import ProviderSync, SyncStatus
+from tracekit.user_context import get_user_id
 
 calendar_bp = Blueprint("calendar", __name__)
 
+_YEAR_MONTH_RE = re.compile(r"\d{4}-\d{2}")
+
 
 @calendar_bp.route("/api/calendar")
 def api_calendar_months():
@@ -23,7 +29,7 @@ def api_calendar_months():
     to_month = request.args.get("to")
     if not from_month or not to_month:
         return jsonify({"error": "Required query params: from, to (YYYY-MM)"}), 400
-    if not re.fullmatch(r"\d{4}-\d{2}", from_month) or not re.fullmatch(r"\d{4}-\d{2}", to_month):
+    if not _YEAR_MONTH_RE.fullmatch(from_month) or not _YEAR_MONTH_RE.fullmatch(to_month):
         return jsonify({"error": "Invalid month format, expected YYYY-MM"}), 400
     if from_month > to_month:
         return jsonify({"error": "'from' must be <= 'to'"}), 400
@@ -42,25 +48,24 @@ def api_calendar_months():
         return jsonify({"error": "Range exceeds 12-month limit"}), 400
 
     config = load_tracekit_config()
-    return jsonify({ym: get_single_month_data(config, ym) for ym in months})
+    return conditional_json(get_months_data(config, months))
 
 
 @calendar_bp.route("/api/calendar/<year_month>")
 def api_calendar_month(year_month: str):
     """Return sync status and activity counts for a single month."""
-    if not re.fullmatch(r"\d{4}-\d{2}", year_month):
+    if not _YEAR_MONTH_RE.fullmatch(year_month):
         return jsonify({"error": "Invalid month format, expected YYYY-MM"}), 400
     config = load_tracekit_config()
-    return jsonify(get_single_month_data(config, year_month))
+    return conditional_json(get_single_month_data(config, year_month))
 
 
 @calendar_bp.route("/api/sync/<year_month>", methods=["POST"])
 def sync_month(year_month: str):
     """Enqueue a pull job for the given YYYY-MM month."""
-    if not re.fullmatch(r"\d{4}-\d{2}", year_month):
+    if not _YEAR_MONTH_RE.fullmatch(year_month):
         return jsonify({"error": "Invalid month format, expected YYYY-MM"}), 400
     try:
-        from tracekit.user_context import get_user_id
         from tracekit.worker import pull_month
 
         task = pull_month.delay(year_month, user_id=get_user_id())
@@ -72,17 +77,12 @@ def sync_month(year_month: str):
 @calendar_bp.route("/api/sync/<year_month>/<provider_name>", methods=["POST"])
 def sync_provider_month(year_month: str, provider_name: str):
     """Enqueue a pull job for a single provider and YYYY-MM month."""
-    if not re.fullmatch(r"\d{4}-\d{2}", year_month):
+    if not _YEAR_MONTH_RE.fullmatch(year_month):
         return jsonify({"error": "Invalid month format, expected YYYY-MM"}), 400
     valid_providers = set(ALL_PROVIDERS)
     if provider_name not in valid_providers:
         return jsonify({"error": f"Unknown provider: {provider_name}"}), 400
     try:
-        from tracekit.provider_status import (
-            PullStatus,
-            is_pull_active,
-            set_pull_status,
-        )
         from tracekit.worker import pull_provider_month
 
         if is_pull_active(year_month, provider_name):
@@ -91,9 +91,6 @@ def sync_provider_month(year_month: str, provider_name: str):
                 409,
             )
 
-        from tracekit.provider_sync import ProviderSync, SyncStatus
-        from tracekit.user_context import get_user_id
-
         ProviderSync.upsert_status(year_month, provider_name, SyncStatus.ENQUEUED)
         task = pull_provider_month.delay(year_month, provider_name, user_id=get_user_id())
         set_pull_status(year_month, provider_name, PullStatus.QUEUED, job_id=task.id)
@@ -113,7 +110,6 @@ def sync_provider_month(year_month: str, provider_name: str):
 def sync_file():
     """Enqueue a full scan of the activities data folder."""
     try:
-        from tracekit.user_context import get_user_id
         from tracekit.worker import pull_file
 
         task = pull_file.delay(user_id=get_user_id())
@@ -129,7 +125,6 @@ def reset_provider_data(provider_name: str):
     if provider_name not in valid_providers:
         return jsonify({"error": f"Unknown provider: {provider_name}"}), 400
     try:
-        from tracekit.user_context import get_user_id
         from tracekit.worker import reset_provider as reset_provider_task
 
         task = reset_provider_task.delay(provider_name, user_id=get_user_id())
@@ -141,10 +136,9 @@ def reset_provider_data(provider_name: str):
 @calendar_bp.route("/api/reset/<year_month>", methods=["POST"])
 def reset_month(year_month: str):
     """Enqueue a reset job for the given YYYY-MM month."""
-    if not re.fullmatch(r"\d{4}-\d{2}", year_month):
+    if not _YEAR_MONTH_RE.fullmatch(year_month):
         return jsonify({"error": "Invalid month format, expected YYYY-MM"}), 400
     try:
-        from tracekit.user_context import get_user_id
         from tracekit.worker import reset_month as reset_month_task
 
         task = reset_month_task.delay(year_month, user_id=get_user_id())
@@ -157,7 +151,6 @@ def reset_month(year_month: str):
 def reset_all():
     """Enqueue a reset-all job that deletes all activities and sync records."""
     try:
-        from tracekit.user_context import get_user_id
         from tracekit.worker import reset_all as reset_all_task
 
         task = reset_all_task.delay(user_id=get_user_id())
@@ -18,14 +18,16 @@ POST /api/month-sync/apply
     Returns: { "task_id": "...", "status": "queued" }
 """
 
+import calendar as _cal
 import re
-from datetime import datetime
 
 from db_init import load_tracekit_config
 from flask import Blueprint, jsonify, render_template, request
 
 month_bp = Blueprint("month", __name__)
 
+_YEAR_MONTH_RE = re.compile(r"\d{4}-\d{2}")
+
 # ---------------------------------------------------------------------------
 # Lazy top-level imports — these may not be available if tracekit is not
 # fully installed (e.g. in unit-test environments without a Celery broker).
@@ -35,6 +37,7 @@ month_bp = Blueprint("month", __name__)
 
 from tracekit.core import tracekit as tracekit_class
 from tracekit.sync import build_comparison_rows, compute_month_changes
+from tracekit.user_context import get_user_id
 
 try:
     from tracekit.worker import apply_sync_change
@@ -45,12 +48,12 @@ except Exception:  # pragma: no cover
 @month_bp.route("/month/<year_month>")
 def month_show(year_month: str):
     """Render the month sync-review page."""
-    if not re.fullmatch(r"\d{4}-\d{2}", year_month):
+    if not _YEAR_MONTH_RE.fullmatch(year_month):
         return "Invalid month format, expected YYYY-MM", 400
 
     config = load_tracekit_config()
     year, month = int(year_month[:4]), int(year_month[5:7])
-    month_name = datetime(year, month, 1).strftime("%B")
+    month_name = _cal.month_name[month]
 
     return render_template(
         "month.html",
@@ -66,7 +69,7 @@ def month_show(year_month: str):
 @month_bp.route("/api/month-changes/<year_month>")
 def api_month_changes(year_month: str):
     """Compute and return pending sync changes for a month as JSON."""
-    if not re.fullmatch(r"\d{4}-\d{2}", year_month):
+    if not _YEAR_MONTH_RE.fullmatch(year_month):
         return jsonify({"error": "Invalid month format, expected YYYY-MM"}), 400
 
     try:
@@ -112,15 +115,13 @@ def api_apply_change():
         )
 
     year_month = data["year_month"]
-    if not re.fullmatch(r"\d{4}-\d{2}", year_month):
+    if not _YEAR_MONTH_RE.fullmatch(year_month):
         return jsonify({"error": "Invalid month format, expected YYYY-MM"}), 400
 
     try:
         if apply_sync_change is None:
             raise RuntimeError("Celery worker not available — is the worker running?")
 
-        from tracekit.user_context import get_user_id
-
         change_dict = data["change"]
         task = apply_sync_change.delay(change_dict, year_month, user_id=get_user_id())
         return jsonify({"task_id": task.id, "year_month": year_month, "status": "queued"})
@@ -1,33 +1,72 @@
 """Notification API routes for the tracekit web app."""
 
+from datetime import UTC, datetime
+
 from db_init import _init_db
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
+
+from tracekit.notification import Notification
+from tracekit.user_context import get_user_id
 
 notifications_bp = Blueprint("notifications", __name__)
 
+# Page size for /api/notifications when ?limit= is omitted, and the cap on it.
+_DEFAULT_LIMIT = 50
+_MAX_LIMIT = 500
+
+
+def _visible():
+    """Filter for the current user's notifications that have not expired."""
+    now = int(datetime.now(UTC).timestamp())
+    return (Notification.user_id == get_user_id()) & ((Notification.expires.is_null()) | (Notification.expires > now))
 
-def _get_notifications_list() -> list[dict]:
-    """Return all non-expired notifications ordered newest-first."""
+
+def _get_cursor(notification_id: int) -> tuple[int, int] | None:
+    """Return the ``(created, id)`` keyset of the current user's notification, or None."""
+    if not _init_db():
+        return None
+    row = (
+        Notification.select(Notification.created, Notification.id)
+        .where((Notification.id == notification_id) & (Notification.user_id == get_user_id()))
+        .tuples()
+        .first()
+    )
+    return tuple(row) if row else None
+
+
+def _get_notifications_list(limit: int = _DEFAULT_LIMIT, before: tuple[int, int] | None = None) -> list[dict]:
+    """Return up to *limit* non-expired notifications ordered newest-first.
+
+    *before* is the ``(created, id)`` keyset of the last notification already
+    shown (see :func:`_get_cursor`); the next page follows the same
+    ``(created, id)`` order, so rows whose ids are out of step with their
+    timestamps are neither skipped nor repeated.
+    """
     if not _init_db():
         return []
     try:
-        from datetime import UTC, datetime
-
-        from tracekit.db import get_db
-        from tracekit.notification import Notification
-        from tracekit.user_context import get_user_id
-
-        get_db().connect(reuse_if_open=True)
-        now = int(datetime.now(UTC).timestamp())
-        rows = (
-            Notification.select()
-            .where(
-                (Notification.user_id == get_user_id())
-                & ((Notification.expires.is_null()) | (Notification.expires > now))
+        # Select exactly the Notification.to_dict() fields as plain dicts —
+        # no model instance is built per row.
+        query = (
+            Notification.select(
+                Notification.id,
+                Notification.message,
+                Notification.category,
+                Notification.read,
+                Notification.created,
+                Notification.expires,
             )
-            .order_by(Notification.created.desc())
+            .where(_visible())
+            .order_by(Notification.created.desc(), Notification.id.desc())
+            .limit(limit)
         )
-        return [r.to_dict() for r in rows]
+        if before is not None:
+            created, notification_id = before
+            query = query.where(
+                (Notification.created < created)
+                | ((Notification.created == created) & (Notification.id < notification_id))
+            )
+        return list(query.dicts())
     except Exception as e:
         print(f"notifications list error: {e}")
         return []
@@ -35,8 +74,32 @@ def _get_notifications_list() -> list[dict]:
 
 @notifications_bp.route("/api/notifications")
 def api_notifications():
-    """Return all notifications ordered newest-first."""
-    return jsonify(_get_notifications_list())
+    """Return one page of notifications ordered newest-first.
+
+    Query params:
+      limit  - page size (default 50, max 500)
+      before - id of the last notification on the previous page
+    """
+    limit = min(max(request.args.get("limit", _DEFAULT_LIMIT, type=int), 1), _MAX_LIMIT)
+    before = request.args.get("before", type=int)
+    cursor = None
+    if before is not None:
+        cursor = _get_cursor(before)
+        if cursor is None:
+            return jsonify({"error": "Unknown notification cursor"}), 400
+    return jsonify(_get_notifications_list(limit, cursor))
+
+
+@notifications_bp.route("/api/notifications/unread-count")
+def api_notifications_unread_count():
+    """Return ``{"unread": n}`` — the bell badge count, computed server-side."""
+    if not _init_db():
+        return jsonify({"error": "Database not available"}), 503
+    try:
+        unread = Notification.select().where(_visible() & (Notification.read == False)).count()
+        return jsonify({"unread": unread})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
 
 @notifications_bp.route("/api/notifications/<int:notification_id>/read", methods=["POST"])
@@ -45,10 +108,6 @@ def api_notification_read(notification_id: int):
     if not _init_db():
         return jsonify({"error": "Database not available"}), 503
     try:
-        from tracekit.db import get_db
-        from tracekit.notification import Notification
-
-        get_db().connect(reuse_if_open=True)
         n = Notification.get_by_id(notification_id)
         n.read = True
         n.save()
@@ -63,11 +122,6 @@ def api_notifications_read_all():
     if not _init_db():
         return jsonify({"error": "Database not available"}), 503
     try:
-        from tracekit.db import get_db
-        from tracekit.notification import Notification
-        from tracekit.user_context import get_user_id
-
-        get_db().connect(reuse_if_open=True)
         Notification.update(read=True).where(
             (Notification.read == False) & (Notification.user_id == get_user_id())
         ).execute()
@@ -82,10 +136,6 @@ def api_notification_delete(notification_id: int):
     if not _init_db():
         return jsonify({"error": "Database not available"}), 503
     try:
-        from tracekit.db import get_db
-        from tracekit.notification import Notification
-
-        get_db().connect(reuse_if_open=True)
         n = Notification.get_by_id(notification_id)
         n.delete_instance()
         return jsonify({"status": "ok"})
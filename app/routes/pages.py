@@ -1,5 +1,6 @@
 """Page routes (HTML views) for the tracekit web app."""
 
+import calendar as _cal
 import os
 from datetime import UTC, datetime
 
@@ -14,6 +15,9 @@ from helpers import (
     get_oldest_activity_month,
 )
 
+from tracekit.appconfig import get_system_providers
+from tracekit.utils import sort_providers
+
 pages_bp = Blueprint("pages", __name__)
 
 
@@ -41,8 +45,6 @@ def settings():
         "intervalsicu": bool(os.environ.get("INTERVALSICU_CLIENT_ID") and os.environ.get("INTERVALSICU_CLIENT_SECRET")),
     }
 
-    from tracekit.appconfig import get_system_providers
-
     enabled_set = {name for name, visible in get_system_providers().items() if visible}
     all_providers = config.get("providers", {})
 
@@ -81,8 +83,6 @@ def gear():
     gear_rows = get_gear_summary(config.get("home_timezone", "UTC"))
 
     # Only show enabled providers as columns, in priority order
-    from tracekit.utils import sort_providers
-
     providers_cfg = config.get("providers", {})
     ordered_providers = [name for name, cfg in sort_providers(providers_cfg) if cfg.get("enabled", False)]
 
@@ -119,22 +119,19 @@ def index():
     current_date = get_current_date_in_timezone(config)
     current_month = f"{current_date.year:04d}-{current_date.month:02d}"
 
+    current = current_date.year * 12 + current_date.month - 1
     months = []
-    year, month = current_date.year, current_date.month
-    for _ in range(12):
-        ym = f"{year:04d}-{month:02d}"
+    for ordinal in range(current, current - 12, -1):
+        year, month = divmod(ordinal, 12)
+        month += 1
         months.append(
             {
-                "year_month": ym,
+                "year_month": f"{year:04d}-{month:02d}",
                 "year": year,
                 "month": month,
-                "month_name": datetime(year, month, 1).strftime("%B"),
+                "month_name": _cal.month_name[month],
             }
         )
-        month -= 1
-        if month == 0:
-            month = 12
-            year -= 1
 
     return render_template(
         "index.html",
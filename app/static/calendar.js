@@ -18,6 +18,12 @@ function formatSyncTime(ts) {
 
 let oldestLoaded = INITIAL_OLDEST || null;
 let _loadingMore  = false;
+// Request for the batch just older than `oldestLoaded`, started when a
+// load-more sentinel scrolls within PREFETCH_MARGIN_PX of its container so
+// the next load rarely waits.  Results older than PREFETCH_TTL_MS are dropped.
+let _prefetch     = null;   // { from, to, promise, at }
+const PREFETCH_MARGIN_PX = 800;
+const PREFETCH_TTL_MS    = 30000;
 
 // ── Build a mini SMTWRFS calendar grid HTML for one provider ─────────────────
 function buildMiniCal(yearMonth, activeDays) {
@@ -503,18 +509,39 @@ function appendTimelineEntry(ym, year, monthNum) {
     else list.appendChild(a);
 }
 
+// ── The 12 months before `ym`, newest first, as [ym, year, month] ────────────
+function _monthsBefore(ym) {
+    let [y, m] = ym.split('-').map(Number);
+    const months = [];
+    for (let i = 0; i < 12; i++) {
+        m--;
+        if (m === 0) { m = 12; y--; }
+        months.push([`${String(y).padStart(4, '0')}-${String(m).padStart(2, '0')}`, y, m]);
+    }
+    return months;
+}
+
+// ── Start fetching the next older batch in the background ─────────────────────
+function _prefetchNextBatch() {
+    if (!oldestLoaded) return;
+    if (OLDEST_ACTIVITY_MONTH && oldestLoaded <= OLDEST_ACTIVITY_MONTH) return;
+    const months = _monthsBefore(oldestLoaded);
+    const from = months[months.length - 1][0];
+    const to   = months[0][0];
+    if (_prefetch && _prefetch.from === from && Date.now() - _prefetch.at < PREFETCH_TTL_MS) return;
+    const promise = fetch('/api/calendar?from=' + from + '&to=' + to).then(res => res.json());
+    promise.catch(() => {});  // surfaced when loadMoreMonths awaits it
+    _prefetch = { from, to, promise, at: Date.now() };
+}
+
 // ── Load 12 more months going back in time ────────────────────────────────────
 async function loadMoreMonths() {
     if (!oldestLoaded || _loadingMore) return;
     // Stop once we've passed the oldest month that has any activity data.
     if (OLDEST_ACTIVITY_MONTH && oldestLoaded <= OLDEST_ACTIVITY_MONTH) return;
     _loadingMore = true;
-    let [y, m] = oldestLoaded.split('-').map(Number);
     const newMonths = [];
-    for (let i = 0; i < 12; i++) {
-        m--;
-        if (m === 0) { m = 12; y--; }
-        const ym = `${String(y).padStart(4, '0')}-${String(m).padStart(2, '0')}`;
+    for (const [ym, y, m] of _monthsBefore(oldestLoaded)) {
         appendMonthCard(ym, y, m);
         appendTimelineEntry(ym, y, m);
         newMonths.push(ym);
@@ -522,9 +549,11 @@ async function loadMoreMonths() {
     }
     const from = newMonths[newMonths.length - 1];
     const to   = newMonths[0];
+    const fresh = _prefetch && _prefetch.from === from && Date.now() - _prefetch.at < PREFETCH_TTL_MS;
+    const pending = fresh ? _prefetch.promise : null;
+    _prefetch = null;
     try {
-        const res  = await fetch('/api/calendar?from=' + from + '&to=' + to);
-        const data = await res.json();
+        const data = await (pending || fetch('/api/calendar?from=' + from + '&to=' + to).then(res => res.json()));
         newMonths.forEach(ym => renderGrid(ym, data[ym] || { error: 'No data' }));
     } catch (e) {
         newMonths.forEach(ym => {
@@ -539,42 +568,39 @@ async function loadMoreMonths() {
 
 // ── Re-check whether sentinels are still visible after a load ────────────────
 // IntersectionObserver only fires on state *changes*; if the sentinel is still
-// visible after inserting 12 months, we need to trigger another load manually.
+// visible (or near) after inserting 12 months, load (or prefetch) manually.
 function _recheckSentinels() {
     if (OLDEST_ACTIVITY_MONTH && oldestLoaded <= OLDEST_ACTIVITY_MONTH) return;
-    const syncContent = document.querySelector('.sync-content');
-    const mainSentinel = document.getElementById('load-more-sentinel');
-    if (syncContent && mainSentinel) {
-        const sr = mainSentinel.getBoundingClientRect();
-        const cr = syncContent.getBoundingClientRect();
-        if (sr.top < cr.bottom && sr.bottom > cr.top) { loadMoreMonths(); return; }
-    }
-    const tlList = document.querySelector('.timeline-list');
-    const tlSentinel = document.getElementById('tl-sentinel');
-    if (tlList && tlSentinel) {
-        const sr = tlSentinel.getBoundingClientRect();
-        const lr = tlList.getBoundingClientRect();
-        if (sr.top < lr.bottom && sr.bottom > lr.top) loadMoreMonths();
+    const pairs = [
+        [document.querySelector('.sync-content'), document.getElementById('load-more-sentinel')],
+        [document.querySelector('.timeline-list'), document.getElementById('tl-sentinel')],
+    ];
+    let near = false;
+    for (const [root, sentinel] of pairs) {
+        if (!root || !sentinel) continue;
+        const sr = sentinel.getBoundingClientRect();
+        const rr = root.getBoundingClientRect();
+        if (sr.top < rr.bottom && sr.bottom > rr.top) { loadMoreMonths(); return; }
+        if (sr.top < rr.bottom + PREFETCH_MARGIN_PX) near = true;
     }
+    if (near) _prefetchNextBatch();
 }
 
 // ── Wire up IntersectionObserver for infinite scroll ──────────────────────────
+// One observer loads when a sentinel becomes visible; a second, with the root
+// grown by PREFETCH_MARGIN_PX, starts fetching that batch as it approaches.
 function setupInfiniteScroll() {
-    const syncContent = document.querySelector('.sync-content');
-    if (syncContent) {
-        const obs = new IntersectionObserver(entries => {
-            if (entries.some(e => e.isIntersecting)) loadMoreMonths();
-        }, { root: syncContent, threshold: 0 });
-        const sentinel = document.getElementById('load-more-sentinel');
-        if (sentinel) obs.observe(sentinel);
-    }
-
-    const tlList = document.querySelector('.timeline-list');
-    if (tlList) {
-        const obs = new IntersectionObserver(entries => {
+    const pairs = [
+        [document.querySelector('.sync-content'), document.getElementById('load-more-sentinel')],
+        [document.querySelector('.timeline-list'), document.getElementById('tl-sentinel')],
+    ];
+    for (const [root, sentinel] of pairs) {
+        if (!root || !sentinel) continue;
+        new IntersectionObserver(entries => {
             if (entries.some(e => e.isIntersecting)) loadMoreMonths();
-        }, { root: tlList, threshold: 0 });
-        const sentinel = document.getElementById('tl-sentinel');
-        if (sentinel) obs.observe(sentinel);
+        }, { root, threshold: 0 }).observe(sentinel);
+        new IntersectionObserver(entries => {
+            if (entries.some(e => e.isIntersecting)) _prefetchNextBatch();
+        }, { root, rootMargin: `0px 0px ${PREFETCH_MARGIN_PX}px 0px`, threshold: 0 }).observe(sentinel);
     }
 }
@@ -10,7 +10,7 @@ import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from calendar_data import get_sync_calendar_data
+from calendar_data import get_calendar_shell, get_months_data, get_single_month_data, get_sync_calendar_data
 from helpers import get_current_date_in_timezone
 from main import app
 
@@ -236,6 +236,107 @@ class TestSyncCalendar:
         assert len(provider_counts) > 0, "Should have at least one provider with activities"
 
 
+class TestCalendarShell:
+    """Tests for the month/provider shell."""
+
+    def test_shell_reflects_sync_row_changes(self, temp_database):
+        """Deleting a month and pulling another is visible on the next call."""
+        from tracekit.provider_sync import ProviderSync
+
+        config = {"home_timezone": "UTC"}
+        first = get_calendar_shell(config)
+        assert "ridewithgps" not in first["providers"]
+
+        # A delete followed by an insert can reuse the freed rowid.
+        ProviderSync.delete().where(ProviderSync.year_month == first["date_range"][0]).execute()
+        ProviderSync.get_or_create(year_month="2023-12", provider="ridewithgps")
+
+        second = get_calendar_shell(config)
+        assert "ridewithgps" in second["providers"]
+        assert second["date_range"][0] == "2023-12"
+
+
+class TestSingleMonthData:
+    """Tests for per-month activity aggregation."""
+
+    def test_counts_and_days_per_provider(self, temp_database):
+        """Each seeded provider reports one activity on the 1st (UTC)."""
+        data = get_single_month_data({"home_timezone": "UTC"}, "2024-02")
+
+        assert "error" not in data
+        assert data["activity_counts"] == {
+            "strava": 1,
+            "garmin": 1,
+            "ridewithgps": 1,
+            "spreadsheet": 1,
+            "file": 1,
+        }
+        assert data["total_activities"] == 5
+        assert data["activity_days"]["strava"] == [1]
+
+    def test_days_use_home_timezone(self, temp_database):
+        """Midnight UTC on Feb 1st is still Jan 31st in US/Pacific."""
+        data = get_single_month_data({"home_timezone": "US/Pacific"}, "2024-02")
+
+        assert data["activity_days"]["garmin"] == [31]
+
+    @pytest.mark.parametrize(
+        ("home_timezone", "start_time", "day"),
+        [
+            # Midnight repeats on 2018-11-04; 04:30 UTC is 00:30 of the first one.
+            ("America/Havana", 1541305800, 4),
+            # Midnight is skipped on 2018-11-04; 02:30 UTC is still 23:30 on the 3rd.
+            ("America/Sao_Paulo", 1541298600, 3),
+        ],
+    )
+    def test_days_across_dst_midnight(self, temp_database, home_timezone, start_time, day):
+        """Days whose local midnight repeats or is skipped start at the right instant."""
+        from tracekit.providers.strava.strava_activity import StravaActivity
+
+        StravaActivity.create(provider_id="dst-midnight", start_time=start_time)
+
+        data = get_single_month_data({"home_timezone": home_timezone}, "2018-11")
+
+        assert data["activity_days"]["strava"] == [day]
+
+    def test_device_metadata(self, temp_database):
+        """Recording devices are reported per provider alongside the counts."""
+        from tracekit.providers.garmin.garmin_activity import GarminActivity
+
+        GarminActivity.update(device_name="Edge 540").execute()
+
+        data = get_single_month_data({"home_timezone": "UTC"}, "2024-02")
+
+        assert data["provider_metadata"] == {"garmin": {"devices": ["Edge 540"]}}
+        assert data["activity_counts"]["garmin"] == 1
+
+    def test_provider_sync_rollup(self, temp_database):
+        """Synced and in-flight providers come from one ProviderSync pass."""
+        from tracekit.provider_sync import ProviderSync, SyncStatus
+
+        ProviderSync.upsert_status("2024-02", "garmin", SyncStatus.ENQUEUED)
+
+        data = get_single_month_data({"home_timezone": "UTC"}, "2024-02")
+
+        assert data["providers"] == ["garmin", "spreadsheet", "strava"]
+        assert data["provider_status"] == {"garmin": False, "spreadsheet": False, "strava": True}
+        assert data["pull_statuses"]["garmin"]["status"] == "queued"
+
+    def test_batch_matches_single_months(self, temp_database):
+        """Batched month data is identical to fetching each month on its own."""
+        from tracekit.provider_sync import ProviderSync, SyncStatus
+
+        ProviderSync.upsert_status("2024-03", "garmin", SyncStatus.ENQUEUED)
+        config = {"home_timezone": "US/Pacific"}
+        months = ["2024-01", "2024-02", "2024-03", "2024-06"]
+
+        batch = get_months_data(config, months)
+
+        assert list(batch) == months
+        for ym in months:
+            assert batch[ym] == get_single_month_data(config, ym)
+
+
 class TestTimezone:
     """Tests for timezone functionality in calendar."""
 
@@ -286,6 +387,31 @@ class TestTimezone:
             assert "total_activities" in month
 
 
+class TestCalendarConditionalGet:
+    """Month JSON carries an ETag and short-circuits unchanged refetches."""
+
+    def test_single_month_revalidates_with_304(self, client, temp_database):
+        first = client.get("/api/calendar/2024-02")
+        assert first.status_code == 200
+        assert first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        second = client.get("/api/calendar/2024-02", headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 304
+        assert second.data == b""
+
+    def test_changed_month_returns_fresh_body(self, client, temp_database):
+        from tracekit.providers.strava.strava_activity import StravaActivity
+
+        etag = client.get("/api/calendar?from=2024-02&to=2024-02").headers["ETag"]
+        # The client's user (id 1) owns no seeded rows, so this is its first activity.
+        StravaActivity.create(provider_id="etag-new", start_time=1706832000, user_id=1)
+
+        response = client.get("/api/calendar?from=2024-02&to=2024-02", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.get_json()["2024-02"]["activity_counts"] == {"strava": 1}
+
+
 class TestCalendarBulkAPI:
     """Tests for GET /api/calendar?from=YYYY-MM&to=YYYY-MM."""
 
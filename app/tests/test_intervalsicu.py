@@ -213,6 +213,15 @@ class TestIntervalsICUCallbackRoute:
         assert resp.status_code == 200
         assert b"authorization denied" in resp.data.lower()
 
+    def test_error_param_is_escaped(self, client):
+        """The error text is HTML-escaped in the page and JSON-encoded for postMessage."""
+        resp = client.get("/api/auth/intervalsicu/callback", query_string={"error": "</script><b>&'\""})
+        body = resp.data.decode()
+
+        assert "</script><b>" not in body
+        assert "&lt;/script&gt;&lt;b&gt;&amp;&#x27;&quot;" in body
+        assert 'message:"Intervals.icu authorization denied: \\u003c/script>\\u003cb>&\'\\""' in body
+
     def test_missing_code_shows_failure_page(self, client):
         """No code param returns failure page."""
         resp = client.get("/api/auth/intervalsicu/callback")
@@ -0,0 +1,45 @@
+"""Tests for the orjson-backed JSON provider."""
+
+import os
+import sys
+from datetime import UTC, datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+pytest.importorskip("orjson")
+
+from flask.json.provider import DefaultJSONProvider
+from json_provider import ORJSONProvider
+from main import app
+
+_PAYLOAD = {
+    "months": [{"year_month": "2024-02", "activity_counts": {"strava": 3}}],
+    "b": None,
+    "a": 1.5,
+    "when": datetime(2024, 2, 1, tzinfo=UTC),
+    "tuple": (1, 2),
+}
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"separators": (",", ":")}, {"indent": 2}])
+def test_matches_default_provider(kwargs):
+    """Output parses identically to Flask's stdlib provider, keys sorted."""
+    fast = ORJSONProvider(app).dumps(_PAYLOAD, **kwargs)
+    slow = DefaultJSONProvider(app).dumps(_PAYLOAD, **kwargs)
+
+    assert app.json.loads(fast) == app.json.loads(slow)
+    assert fast.index('"a"') < fast.index('"b"')
+
+
+def test_falls_back_for_unsupported_values():
+    """Integers beyond 64 bits are handed to the stdlib encoder."""
+    assert ORJSONProvider(app).dumps({"n": 2**70}) == '{"n": 1180591620717411303424}'
+
+
+def test_documented_differences_from_default_provider():
+    """Non-ASCII text is emitted as UTF-8 and non-finite floats as null."""
+    out = ORJSONProvider(app).dumps({"name": "café", "nan": float("nan"), "inf": float("inf")})
+
+    assert out == '{"inf":null,"name":"café","nan":null}'
@@ -334,6 +334,21 @@ class TestWebRoutes:
         resp2 = client.get("/api/config")
         assert resp2.get_json()["home_timezone"] == "US/Mountain"
 
+    def test_api_config_revalidates_until_saved(self, client, temp_database):
+        """GET /api/config answers 304 for an unchanged config and 200 after a PUT."""
+        etag = client.get("/api/config").headers["ETag"]
+
+        assert client.get("/api/config", headers={"If-None-Match": etag}).status_code == 304
+
+        client.put(
+            "/api/config",
+            data=json.dumps({**_CONFIG_DATA, "home_timezone": "US/Mountain"}),
+            content_type="application/json",
+        )
+        response = client.get("/api/config", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.get_json()["home_timezone"] == "US/Mountain"
+
     def test_api_database_route(self, client, temp_database):
         """GET /api/database returns table counts."""
         response = client.get("/api/database")
@@ -369,10 +384,103 @@ class TestWebRoutes:
         assert data["status"] == "healthy"
         assert data["app"] == "tracekit-web"
 
+    def test_db_connect_failure_returns_503(self, client):
+        """Requests needing the DB get a 503 when it cannot connect; /health still answers."""
+        with patch("main._ensure_db_connected", return_value=False):
+            assert client.get("/settings").status_code == 503
+            assert client.get("/health").status_code == 200
+
     def test_404_route(self, client):
         response = client.get("/nonexistent")
         assert response.status_code == 404
 
+    def test_api_notifications_route(self, client, temp_database):
+        """GET /api/notifications returns the user's live notifications newest-first."""
+        from tracekit.notification import Notification
+
+        Notification.create(message="older", created=100, user_id=1)
+        Notification.create(message="newer", category="error", created=200, user_id=1)
+        Notification.create(message="expired", created=300, expires=1, user_id=1)
+        Notification.create(message="other user", created=400, user_id=2)
+
+        response = client.get("/api/notifications")
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [n["message"] for n in data] == ["newer", "older"]
+        assert data[0] == {
+            "id": data[0]["id"],
+            "message": "newer",
+            "category": "error",
+            "read": False,
+            "created": 200,
+            "expires": None,
+        }
+
+    def test_api_notifications_pagination(self, client, temp_database):
+        """limit and before page through notifications newest-first."""
+        from tracekit.notification import Notification
+
+        for i in range(5):
+            Notification.create(message=f"n{i}", created=100 + i, user_id=1)
+
+        first = client.get("/api/notifications?limit=2").get_json()
+        assert [n["message"] for n in first] == ["n4", "n3"]
+
+        second = client.get(f"/api/notifications?limit=2&before={first[-1]['id']}").get_json()
+        assert [n["message"] for n in second] == ["n2", "n1"]
+
+
+    def test_api_notifications_cursor_follows_created_order(self, client, temp_database):
+        """The before cursor pages by (created, id), not by id alone."""
+        from tracekit.notification import Notification
+
+        # Inserted out of timestamp order, so ids disagree with created.
+        for message, created in [("b", 200), ("a", 100), ("d", 400), ("c", 300), ("c2", 300)]:
+            Notification.create(message=message, created=created, user_id=1)
+
+        seen = []
+        before = ""
+        while page := client.get(f"/api/notifications?limit=2{before}").get_json():
+            seen += [n["message"] for n in page]
+            before = f"&before={page[-1]['id']}"
+
+        assert seen == ["d", "c2", "c", "b", "a"]
+
+    def test_api_notifications_default_page_is_bounded(self, client, temp_database):
+        """Without ?limit= only the newest 50 notifications are returned."""
+        from tracekit.notification import Notification
+
+        Notification.insert_many([{"message": f"n{i}", "created": i, "user_id": 1} for i in range(60)]).execute()
+
+        data = client.get("/api/notifications").get_json()
+
+        assert len(data) == 50
+        assert data[0]["message"] == "n59"
+
+    def test_api_notifications_unknown_cursor_rejected(self, client, temp_database):
+        """A before id that is missing or owned by another user is a 400."""
+        from tracekit.notification import Notification
+
+        other = Notification.create(message="other user", created=100, user_id=2)
+
+        assert client.get("/api/notifications?before=999999").status_code == 400
+        assert client.get(f"/api/notifications?before={other.id}").status_code == 400
+
+    def test_api_notifications_unread_count(self, client, temp_database):
+        """The badge count comes from the server, regardless of page size."""
+        from tracekit.notification import Notification
+
+        Notification.create(message="unread", created=100, user_id=1)
+        Notification.create(message="read", created=200, read=True, user_id=1)
+        Notification.create(message="expired", created=300, expires=1, user_id=1)
+        Notification.create(message="other user", created=400, user_id=2)
+
+        response = client.get("/api/notifications/unread-count")
+
+        assert response.status_code == 200
+        assert response.get_json() == {"unread": 1}
+
 
 # ---------------------------------------------------------------------------
 # TestSettingsRoute
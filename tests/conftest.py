@@ -29,6 +29,9 @@ def test_db():
     db.connect()
     migrate_tables(get_all_models())
     yield
+    # close() only hands a pooled connection back; close_all() really closes
+    # it so SQLite checkpoints the WAL and removes the -wal/-shm files.
     db.close()
+    db.close_all()
     if os.path.exists(test_db_path):
         os.remove(test_db_path)
@@ -41,6 +41,21 @@ class TesttracekitCore:
         assert "home_timezone" in tracekit.config
         assert "providers" in tracekit.config
 
+    def test_config_file_reparsed_only_when_changed(self, monkeypatch, tmp_path):
+        """Test that the JSON config file cache follows edits and is not mutated by callers."""
+        path = tmp_path / "tracekit_config.json"
+        path.write_text('{"home_timezone": "US/Pacific", "debug": false}')
+        monkeypatch.setattr(tcfg, "_FILE_PATHS", [path])
+        AppConfig.delete().execute()
+
+        config = tcfg.load_config()
+        assert config["home_timezone"] == "US/Pacific"
+        config["home_timezone"] = "mutated"
+        assert tcfg._load_from_file()["home_timezone"] == "US/Pacific"
+
+        path.write_text('{"home_timezone": "Europe/London", "debug": false}')
+        assert tcfg.load_config()["home_timezone"] == "Europe/London"
+
     def test_enabled_providers_empty(self, monkeypatch):
         """Test enabled_providers when no providers are enabled."""
         monkeypatch.setattr(tcfg, "_FILE_PATHS", [])
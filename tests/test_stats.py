@@ -0,0 +1,103 @@
+"""Tests for tracekit.stats activity queries."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import tracekit.stats as stats
+from tracekit.providers.file.file_activity import FileActivity
+from tracekit.providers.garmin.garmin_activity import GarminActivity
+from tracekit.providers.strava.strava_activity import StravaActivity
+from tracekit.stats import (
+    get_activity_counts_by_user,
+    get_most_recent_activity,
+    get_oldest_activity_month,
+    get_provider_activity_counts,
+)
+from tracekit.user_context import set_user_id
+
+_UID = 4242
+
+
+@pytest.fixture
+def scoped_activities():
+    """Seed a few activities under a dedicated user id and clean them up."""
+    set_user_id(_UID)
+    rows = [
+        StravaActivity.create(provider_id="stats-s1", start_time=1_700_000_000, user_id=_UID),
+        GarminActivity.create(provider_id="stats-g1", start_time=1_710_000_000, user_id=_UID),
+        GarminActivity.create(provider_id="stats-g2", start_time=None, user_id=_UID),
+    ]
+    yield
+    for row in rows:
+        row.delete_instance()
+
+
+def test_provider_activity_counts(scoped_activities):
+    counts = get_provider_activity_counts()
+
+    assert counts["strava"] == 1
+    assert counts["garmin"] == 2
+    assert counts["file"] == 0
+    assert set(counts) == {"strava", "garmin", "ridewithgps", "intervalsicu", "spreadsheet", "file"}
+
+
+def test_activity_counts_by_user(scoped_activities):
+    counts = get_activity_counts_by_user()
+
+    assert counts[_UID] == {"strava": 1, "garmin": 2}
+
+
+def test_most_recent_activity(scoped_activities):
+    result = get_most_recent_activity("UTC")
+
+    assert result["timestamp"] == 1_710_000_000
+    assert result["formatted"] == "9 Mar 2024, 16:00 UTC"
+
+
+def test_most_recent_activity_none():
+    set_user_id(_UID + 1)
+
+    assert get_most_recent_activity("UTC") == {"timestamp": None, "formatted": None}
+
+
+def test_oldest_activity_month(scoped_activities):
+    assert get_oldest_activity_month() == "2023-11"
+
+
+def test_oldest_activity_month_none():
+    set_user_id(_UID + 1)
+
+    assert get_oldest_activity_month() is None
+
+
+def test_activity_dates_skip_a_broken_table(scoped_activities):
+    """A failing provider table only drops itself, not the whole result."""
+
+    class MissingActivity(StravaActivity):
+        class Meta:
+            table_name = "missing_activities"
+
+    with patch.dict(stats._PROVIDER_MODELS, {"missing": MissingActivity}):
+        assert get_most_recent_activity("UTC")["timestamp"] == 1_710_000_000
+        assert get_oldest_activity_month() == "2023-11"
+
+
+def test_database_info_uses_postgres_estimates(scoped_activities):
+    """Tables with a positive pg_class estimate use it; 0 and -1 are counted exactly."""
+    cursor = MagicMock()
+    cursor.fetchall.return_value = [
+        ("strava_activities", 12345),
+        ("garmin_activities", 0),
+        ("file_activities", -1),
+    ]
+    fake_db = MagicMock(obj=object())
+    fake_db.execute_sql.return_value = cursor
+
+    with patch.object(stats, "db", fake_db):
+        info = stats.get_database_info()
+
+    assert info["tables"]["strava_activities"] == 12345
+    assert info["tables"]["garmin_activities"] == GarminActivity.select().count() > 0
+    assert info["tables"]["file_activities"] == FileActivity.select().count()
+    assert info["total_tables"] == len(stats.get_all_models())
@@ -98,6 +98,9 @@ _FILE_PATHS: list[Path] = [
     Path("../tracekit_config.json"),
 ]
 
+# {path: ((st_mtime_ns, st_size), parsed)} — see _load_from_file.
+_file_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 # ---------------------------------------------------------------------------
 # Model
@@ -138,14 +141,28 @@ def _load_from_db() -> dict[str, Any] | None:
 
 
 def _load_from_file() -> dict[str, Any] | None:
-    """Try each candidate path; return parsed JSON or ``None``."""
+    """Try each candidate path; return parsed JSON or ``None``.
+
+    Parsed files are cached against their mtime and size, so an unchanged
+    file costs one ``stat`` per call.  The returned dict is shared with the
+    cache and must not be mutated — copy it before handing it out.
+    """
     for path in _FILE_PATHS:
-        if path.exists():
-            try:
-                with open(path) as f:
-                    return json.load(f)
-            except Exception:
-                pass
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _file_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            with open(path) as f:
+                parsed = json.load(f)
+        except Exception:
+            continue
+        _file_cache[path] = (stamp, parsed)
+        return parsed
     return None
 
 
@@ -187,14 +204,14 @@ def load_config() -> dict[str, Any]:
         get_db()  # raises RuntimeError if not yet configured
     except RuntimeError:
         # DB not available — best-effort fallback, nothing persisted
-        return _load_from_file() or copy.deepcopy(DEFAULT_CONFIG)
+        return copy.deepcopy(_load_from_file() or DEFAULT_CONFIG)
 
     file_cfg = _load_from_file()
     db_cfg = _load_from_db()
 
     if db_cfg is None:
         # First boot — seed from file or defaults
-        source = file_cfg if file_cfg is not None else copy.deepcopy(DEFAULT_CONFIG)
+        source = copy.deepcopy(file_cfg if file_cfg is not None else DEFAULT_CONFIG)
         save_config(source)
         return source
 
@@ -202,7 +219,7 @@ def load_config() -> dict[str, Any]:
         # File has been updated since last boot — sync changes into the DB.
         # We do a key-level merge so that keys only present in the DB
         # (added via settings UI) are not deleted.
-        merged = {**db_cfg, **file_cfg}
+        merged = {**db_cfg, **copy.deepcopy(file_cfg)}
         save_config(merged)
         return _backfill_provider_defaults(merged)
 
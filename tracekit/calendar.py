@@ -8,9 +8,59 @@ database is initialised before calling these functions.
 from __future__ import annotations
 
 import calendar as _cal
-from datetime import UTC, datetime
+import logging
+import operator
+from bisect import bisect_right
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache, reduce
 from typing import Any
 
+import pytz
+from peewee import SQL, Case, Value, fn
+
+from tracekit.provider_status import get_months_pull_statuses, get_months_sync_status
+from tracekit.provider_sync import ProviderSync, SyncStatus
+from tracekit.providers.activities import PROVIDER_ACTIVITY_MODELS as _PROVIDER_MODELS
+from tracekit.user_context import get_user_id
+from tracekit.utils import get_timezone
+
+log = logging.getLogger(__name__)
+
+# Every modern UTC offset is a whole multiple of 15 minutes, so a 15-minute
+# bucket never straddles a local midnight and can be mapped to a day afterwards.
+_DAY_BUCKET_SECONDS = 900
+
+# calendar.month_name formats lazily on every lookup; materialise it once.
+_MONTH_NAMES = tuple(_cal.month_name)
+
+
+def _local_day_boundaries(start_ts: int, end_ts: int, tz: pytz.tzinfo.BaseTzInfo) -> tuple[list[int], list[int]]:
+    """Return ``(midnights, day_numbers)`` for the local days spanning a UTC range.
+
+    ``midnights[i]`` is the Unix timestamp of local midnight starting a day whose
+    day-of-month is ``day_numbers[i]``.  Both lists ascend, so
+    ``day_numbers[bisect_right(midnights, ts) - 1]`` is the local day of *ts*.
+    Each midnight is localised individually, so DST shifts are honoured: a
+    repeated midnight starts the day at its first occurrence and a skipped one
+    at the first instant after the gap, as converting each timestamp would.
+    """
+    day = datetime.fromtimestamp(start_ts, tz=UTC).astimezone(tz).date()
+    last = datetime.fromtimestamp(end_ts, tz=UTC).astimezone(tz).date()
+    midnights: list[int] = []
+    day_numbers: list[int] = []
+    while day <= last:
+        naive = datetime(day.year, day.month, day.day)
+        try:
+            local = tz.localize(naive, is_dst=None)
+        except pytz.AmbiguousTimeError:
+            local = tz.localize(naive, is_dst=True)
+        except pytz.NonExistentTimeError:
+            local = tz.localize(naive, is_dst=False)
+        midnights.append(int(local.timestamp()))
+        day_numbers.append(day.day)
+        day += timedelta(days=1)
+    return midnights, day_numbers
+
 
 def get_calendar_shell(home_timezone: str = "UTC") -> dict[str, Any]:
     """Return month stubs and provider list — no activity table scans.
@@ -30,19 +80,25 @@ def get_calendar_shell(home_timezone: str = "UTC") -> dict[str, Any]:
         }
         or {"error": str} on failure.
     """
-    import pytz
+    uid = get_user_id()
 
-    from tracekit.provider_sync import ProviderSync
-    from tracekit.user_context import get_user_id
+    current_date = datetime.now(get_timezone(home_timezone)).date()
+    current_ym = f"{current_date.year:04d}-{current_date.month:02d}"
 
-    rows = (
-        ProviderSync.select(ProviderSync.year_month, ProviderSync.provider)
-        .where(ProviderSync.user_id == get_user_id())
-        .order_by(ProviderSync.year_month, ProviderSync.provider)
+    # One row per provider with its month range — the DB aggregates instead of
+    # every sync record being materialised here.
+    ranges = list(
+        ProviderSync.select(
+            ProviderSync.provider,
+            fn.MIN(ProviderSync.year_month),
+            fn.MAX(ProviderSync.year_month),
+        )
+        .where(ProviderSync.user_id == uid)
+        .group_by(ProviderSync.provider)
+        .tuples()
     )
-    records = [(r.year_month, r.provider) for r in rows]
 
-    if not records:
+    if not ranges:
         return {
             "months": [],
             "providers": [],
@@ -50,39 +106,29 @@ def get_calendar_shell(home_timezone: str = "UTC") -> dict[str, Any]:
             "total_months": 0,
         }
 
-    year_months_all = [r[0] for r in records]
-    date_range = (min(year_months_all), max(year_months_all))
-    providers = sorted({r[1] for r in records})
+    date_range = (min(r[1] for r in ranges), max(r[2] for r in ranges))
+    providers = sorted(r[0] for r in ranges)
 
     start_year, start_month = map(int, date_range[0].split("-"))
     end_year, end_month = map(int, date_range[1].split("-"))
 
-    try:
-        tz = pytz.timezone(home_timezone)
-        current_date = datetime.now(tz).date()
-    except Exception:
-        current_date = datetime.now(pytz.UTC).date()
-
-    current_ym = f"{current_date.year:04d}-{current_date.month:02d}"
     if current_ym > date_range[1]:
         end_year, end_month = current_date.year, current_date.month
 
+    first = start_year * 12 + start_month - 1
+    last = end_year * 12 + end_month - 1
     all_months = []
-    year, month = start_year, start_month
-    while year < end_year or (year == end_year and month <= end_month):
-        ym = f"{year:04d}-{month:02d}"
+    for ordinal in range(first, last + 1):
+        year, month = divmod(ordinal, 12)
+        month += 1
         all_months.append(
             {
-                "year_month": ym,
+                "year_month": f"{year:04d}-{month:02d}",
                 "year": year,
                 "month": month,
-                "month_name": datetime(year, month, 1).strftime("%B"),
+                "month_name": _MONTH_NAMES[month],
             }
         )
-        month += 1
-        if month > 12:
-            month = 1
-            year += 1
 
     return {
         "months": all_months,
@@ -92,6 +138,19 @@ def get_calendar_shell(home_timezone: str = "UTC") -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=256)
+def _month_bounds(year_month: str) -> tuple[int, int, str, int, int]:
+    """Return ``(year, month, month_name, start_ts, end_ts)`` for a ``YYYY-MM`` string.
+
+    The timestamps are the first and last second of the month in UTC.
+    """
+    year, month = map(int, year_month.split("-"))
+    last_day = _cal.monthrange(year, month)[1]
+    start_ts = _cal.timegm((year, month, 1, 0, 0, 0))
+    end_ts = _cal.timegm((year, month, last_day, 23, 59, 59))
+    return year, month, _MONTH_NAMES[month], start_ts, end_ts
+
+
 def get_single_month_data(year_month: str, home_timezone: str = "UTC") -> dict[str, Any]:
     """Return sync status and activity counts for one month.
 
@@ -109,138 +168,153 @@ def get_single_month_data(year_month: str, home_timezone: str = "UTC") -> dict[s
         provider_metadata, activity_days.
         or {"error": str} on failure.
     """
-    import pytz
-
-    from tracekit.provider_status import get_month_pull_statuses, get_month_sync_status
-    from tracekit.provider_sync import ProviderSync, SyncStatus
-    from tracekit.providers.file.file_activity import FileActivity
-    from tracekit.providers.garmin.garmin_activity import GarminActivity
-    from tracekit.providers.intervalsicu.intervalsicu_activity import (
-        IntervalsICUActivity,
-    )
-    from tracekit.providers.ridewithgps.ridewithgps_activity import RideWithGPSActivity
-    from tracekit.providers.spreadsheet.spreadsheet_activity import SpreadsheetActivity
-    from tracekit.providers.strava.strava_activity import StravaActivity
-    from tracekit.user_context import get_user_id
+    return get_months_data([year_month], home_timezone)[year_month]
+
 
-    pull_statuses = get_month_pull_statuses(year_month)
-    month_sync_status = get_month_sync_status(year_month)
+def get_months_data(year_months: list[str], home_timezone: str = "UTC") -> dict[str, dict[str, Any]]:
+    """Return ``{year_month: month_data}`` for several months at once.
+
+    Each value has the shape documented on :func:`get_single_month_data`.  The
+    work is shared across months: pull statuses, review statuses, provider
+    sync rows and activities are each read with one query spanning the whole
+    set, so a batch costs the same number of round trips as a single month.
+    """
+    if not year_months:
+        return {}
+
+    pull_statuses = get_months_pull_statuses(year_months)
+    month_sync_statuses = get_months_sync_status(year_months)
 
     uid = get_user_id()
 
-    # Only fully-synced months count as "synced"
-    synced_rows = ProviderSync.select(ProviderSync.provider).where(
-        (ProviderSync.year_month == year_month)
-        & (ProviderSync.user_id == uid)
-        & (ProviderSync.status == SyncStatus.DONE)
+    # One grouped pass over the user's ProviderSync rows yields every provider
+    # that has ever synced alongside its status in each requested month.  Rows
+    # outside the set collapse into a single (provider, NULL) group so the
+    # provider still appears; the unique index guarantees at most one row per
+    # provider and month, so MAX() just picks that row's status.
+    in_months = ProviderSync.year_month.in_(year_months)
+    status_rows = (
+        ProviderSync.select(
+            ProviderSync.provider,
+            Case(None, [(in_months, ProviderSync.year_month)]).alias("ym"),
+            fn.MAX(Case(None, [(in_months, ProviderSync.status)])),
+        )
+        .where(ProviderSync.user_id == uid)
+        .group_by(ProviderSync.provider, SQL("ym"))
+        .tuples()
     )
-    synced_providers = [r.provider for r in synced_rows]
+    statuses: dict[str, dict[str, str]] = {ym: {} for ym in year_months}
+    all_providers: set[str] = set()
+    for provider, ym, status in status_rows:
+        all_providers.add(provider)
+        if ym is not None:
+            statuses[ym][provider] = status
+    providers = sorted(all_providers)
+
+    local_tz = get_timezone(home_timezone)
+    bounds = {ym: _month_bounds(ym) for ym in year_months}
+    ordered = sorted(year_months, key=lambda ym: bounds[ym][3])
+    month_starts = [bounds[ym][3] for ym in ordered]
+    day_index = {ym: _local_day_boundaries(bounds[ym][3], bounds[ym][4], local_tz) for ym in year_months}
+
+    counts: dict[str, dict[str, int]] = {ym: dict.fromkeys(_PROVIDER_MODELS, 0) for ym in year_months}
+    days: dict[str, dict[str, set[int]]] = {ym: {p: set() for p in _PROVIDER_MODELS} for ym in year_months}
+    devices: dict[str, dict[str, set[str]]] = {ym: {p: set() for p in _PROVIDER_MODELS} for ym in year_months}
+
+    # A single UNION ALL of per-provider grouped queries yields the count, the
+    # day-of-month set and the recording devices for every provider in one
+    # round trip.  Rows are bucketed server-side so only one row per occupied
+    # bucket and device crosses the wire instead of one per activity.  UTC
+    # month starts fall on bucket boundaries, so each bucket lies in exactly
+    # one month; buckets in gaps between non-adjacent months are skipped.
+    range_start = month_starts[0]
+    range_end = max(b[4] for b in bounds.values())
+    try:
+        query = reduce(
+            operator.add,
+            (
+                model.select(
+                    Value(provider).alias("provider"),
+                    (model.start_time / _DAY_BUCKET_SECONDS).alias("bucket"),
+                    model.device_name,
+                    fn.COUNT(model.id).alias("n"),
+                )
+                .where(model.start_time.between(range_start, range_end) & (model.user_id == uid))
+                .group_by(SQL("bucket"), model.device_name)
+                for provider, model in _PROVIDER_MODELS.items()
+            ),
+        )
+        for provider, bucket_index, device_name, n in query.tuples():
+            ts = bucket_index * _DAY_BUCKET_SECONDS
+            ym = ordered[bisect_right(month_starts, ts) - 1]
+            if ts > bounds[ym][4]:
+                continue
+            midnights, day_numbers = day_index[ym]
+            counts[ym][provider] += n
+            days[ym][provider].add(day_numbers[bisect_right(midnights, ts) - 1])
+            if device_name:
+                devices[ym][provider].add(device_name)
+    except Exception:
+        log.exception("Error counting activities for %s", ", ".join(year_months))
+
+    return {
+        ym: _build_month_data(
+            ym,
+            bounds[ym],
+            providers,
+            statuses[ym],
+            pull_statuses[ym],
+            month_sync_statuses[ym],
+            counts[ym],
+            days[ym],
+            devices[ym],
+        )
+        for ym in year_months
+    }
+
+
+def _build_month_data(
+    year_month: str,
+    bounds: tuple[int, int, str, int, int],
+    providers: list[str],
+    month_statuses: dict[str, str],
+    pull_statuses: dict[str, dict],
+    month_sync_status: str,
+    counts: dict[str, int],
+    days: dict[str, set[int]],
+    devices: dict[str, set[str]],
+) -> dict[str, Any]:
+    """Assemble one month's payload from the rows gathered by :func:`get_months_data`."""
+    # Only fully-synced months count as "synced"
+    provider_status = {p: month_statuses.get(p) == SyncStatus.DONE for p in providers}
+    synced_providers = [p for p, synced in provider_status.items() if synced]
 
     # Providers currently in-flight: synthesize pull_statuses entries so the UI
     # renders spinners and starts polling even after a page reload.
-    in_flight_rows = ProviderSync.select().where(
-        (ProviderSync.year_month == year_month)
-        & (ProviderSync.user_id == uid)
-        & (ProviderSync.status != SyncStatus.DONE)
-    )
-    for row in in_flight_rows:
-        existing = pull_statuses.get(row.provider)
+    for provider, status in month_statuses.items():
+        if status is None or status == SyncStatus.DONE:
+            continue
+        existing = pull_statuses.get(provider)
         if not existing or existing.get("status") not in ("queued", "started"):
-            pull_statuses[row.provider] = {
-                "status": "queued" if row.status == SyncStatus.ENQUEUED else "started",
+            pull_statuses[provider] = {
+                "status": "queued" if status == SyncStatus.ENQUEUED else "started",
                 "job_id": None,
                 "message": None,
                 "updated_at": None,
             }
 
-    all_rows = ProviderSync.select(ProviderSync.provider).where(ProviderSync.user_id == uid).distinct()
-    providers = sorted({r.provider for r in all_rows})
-
-    provider_status = {p: p in synced_providers for p in providers}
-
-    year_int, month_int = map(int, year_month.split("-"))
-    start_ts = int(datetime(year_int, month_int, 1, tzinfo=UTC).timestamp())
-    last_day = _cal.monthrange(year_int, month_int)[1]
-    end_ts = int(datetime(year_int, month_int, last_day, 23, 59, 59, tzinfo=UTC).timestamp())
-
-    provider_models: dict[str, Any] = {
-        "strava": StravaActivity,
-        "garmin": GarminActivity,
-        "ridewithgps": RideWithGPSActivity,
-        "intervalsicu": IntervalsICUActivity,
-        "spreadsheet": SpreadsheetActivity,
-        "file": FileActivity,
-    }
-
-    activity_counts: dict[str, int] = {}
-    for provider, model in provider_models.items():
-        try:
-            count = (
-                model.select()
-                .where(
-                    model.start_time.is_null(False)
-                    & (model.start_time >= start_ts)
-                    & (model.start_time <= end_ts)
-                    & (model.user_id == uid)
-                )
-                .count()
-            )
-            if count > 0:
-                activity_counts[provider] = count
-        except Exception as e:
-            print(f"Error counting {provider} activities for {year_month}: {e}")
+    activity_counts: dict[str, int] = {p: n for p, n in counts.items() if n > 0}
+    activity_days: dict[str, list[int]] = {p: sorted(days[p]) for p in activity_counts}
+    provider_metadata: dict[str, dict] = {p: {"devices": sorted(d)} for p, d in devices.items() if d}
 
     total_activities = sum(activity_counts.values())
 
-    try:
-        local_tz = pytz.timezone(home_timezone)
-    except Exception:
-        local_tz = pytz.utc
-
-    activity_days: dict[str, list[int]] = {}
-    for provider, model in provider_models.items():
-        if provider not in activity_counts:
-            continue
-        try:
-            rows_ts = model.select(model.start_time).where(
-                model.start_time.is_null(False)
-                & (model.start_time >= start_ts)
-                & (model.start_time <= end_ts)
-                & (model.user_id == uid)
-            )
-            days = sorted({datetime.fromtimestamp(r.start_time, tz=UTC).astimezone(local_tz).day for r in rows_ts})
-            if days:
-                activity_days[provider] = days
-        except Exception as e:
-            print(f"Error getting activity days for {provider}/{year_month}: {e}")
-
-    provider_metadata: dict[str, dict] = {}
-    for provider, model in provider_models.items():
-        if provider not in activity_counts:
-            continue
-        try:
-            rows = (
-                model.select(model.device_name)
-                .where(
-                    model.start_time.is_null(False)
-                    & (model.start_time >= start_ts)
-                    & (model.start_time <= end_ts)
-                    & model.device_name.is_null(False)
-                    & (model.user_id == uid)
-                )
-                .distinct()
-            )
-            devices = sorted({r.device_name for r in rows if r.device_name})
-            if devices:
-                provider_metadata[provider] = {"devices": devices}
-        except Exception:
-            pass
-
+    year_int, month_int, month_name, _, _ = bounds
     return {
         "year_month": year_month,
         "year": year_int,
         "month": month_int,
-        "month_name": datetime(year_int, month_int, 1).strftime("%B"),
+        "month_name": month_name,
         "providers": providers,
         "synced_providers": synced_providers,
         "provider_status": provider_status,
@@ -45,14 +45,15 @@ def run(args=None) -> None:
     if parsed.months > 0:
         months = months[: parsed.months]
 
-    from tracekit.calendar import get_single_month_data
+    from tracekit.calendar import get_months_data
+
+    months_data = get_months_data([stub["year_month"] for stub in months], home_timezone)
 
     # Build the table
     headers = ["Month"] + [p.title() for p in providers]
     rows = []
     for stub in months:
-        ym = stub["year_month"]
-        month_data = get_single_month_data(ym, home_timezone)
+        month_data = months_data[stub["year_month"]]
         if month_data.get("error"):
             row = [f"{stub['month_name']} {stub['year']}"] + ["?"] * len(providers)
         else:
@@ -232,7 +232,7 @@ class Tracekit:
         # Delete every provider-specific activity table for the month
         for model_cls in BaseProviderActivity.__subclasses__():
             model_cls.delete().where(
-                (model_cls.start_time >= start_ts) & (model_cls.start_time <= end_ts) & (model_cls.user_id == uid)
+                model_cls.start_time.between(start_ts, end_ts) & (model_cls.user_id == uid)
             ).execute()
 
         # Clear sync-state so the month is treated as never-synced
@@ -1,12 +1,18 @@
 import os
 
-from peewee import Proxy, SqliteDatabase
+from peewee import Proxy
+from playhouse.pool import PooledSqliteDatabase
 
 # Use a Proxy object that can be configured later
 db = Proxy()
 
 _configured = False
 
+# Connections are returned to the pool when closed (the web app closes at the
+# end of every request) and recycled once idle for longer than the timeout.
+_POOL_MAX_CONNECTIONS = 8
+_POOL_STALE_TIMEOUT = 300  # seconds
+
 
 def configure_db(db_path: str = "metadata.sqlite3"):
     """Configure the database backend.
@@ -24,12 +30,24 @@ def configure_db(db_path: str = "metadata.sqlite3"):
             # installed for postgres:// URLs (see [production] extra).
             from playhouse.db_url import connect
 
-            database = connect(database_url)
+            # The "+pool" scheme selects the pooled variant, so closing a
+            # connection hands it back for reuse instead of tearing down TCP.
+            scheme, sep, rest = database_url.partition("://")
+            if not scheme.endswith("+pool"):
+                database_url = f"{scheme}+pool{sep}{rest}"
+            database = connect(database_url, max_connections=_POOL_MAX_CONNECTIONS, stale_timeout=_POOL_STALE_TIMEOUT)
         else:
-            database = SqliteDatabase(
+            database = PooledSqliteDatabase(
                 db_path,
+                max_connections=_POOL_MAX_CONNECTIONS,
+                stale_timeout=_POOL_STALE_TIMEOUT,
+                check_same_thread=False,  # pooled connections move between threads
                 pragmas={
                     "journal_mode": "wal",  # safe concurrent readers
+                    "synchronous": "normal",  # durable under WAL, fewer fsyncs
+                    "cache_size": -64000,  # 64 MB page cache per connection
+                    "temp_store": "memory",
+                    "mmap_size": 256 * 1024 * 1024,
                     "foreign_keys": 1,
                 },
             )
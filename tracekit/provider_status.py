@@ -234,23 +234,28 @@ def set_pull_status(
 
 def get_month_pull_statuses(year_month: str) -> dict[str, dict]:
     """Return {provider: status_dict} for all pull status rows in *year_month*."""
+    return get_months_pull_statuses([year_month])[year_month]
+
+
+def get_months_pull_statuses(year_months: list[str]) -> dict[str, dict[str, dict]]:
+    """Return {year_month: {provider: status_dict}} for every month in *year_months*, in one query."""
+    result: dict[str, dict[str, dict]] = {ym: {} for ym in year_months}
     try:
         _ensure_connected()
         rows = ProviderPullStatus.select().where(
-            (ProviderPullStatus.year_month == year_month) & (ProviderPullStatus.user_id == get_user_id())
+            (ProviderPullStatus.year_month.in_(year_months)) & (ProviderPullStatus.user_id == get_user_id())
         )
-        return {
-            row.provider: {
+        for row in rows:
+            result[row.year_month][row.provider] = {
                 "status": row.status,
                 "job_id": row.job_id,
                 "message": row.message,
                 "updated_at": row.updated_at,
             }
-            for row in rows
-        }
     except Exception as exc:
         print(f"[provider_status] failed to get month pull statuses: {exc}")
-        return {}
+        return {ym: {} for ym in year_months}
+    return result
 
 
 def is_pull_active(year_month: str, provider: str) -> bool:
@@ -318,12 +323,21 @@ def set_month_sync_status(year_month: str, status: str) -> None:
 
 def get_month_sync_status(year_month: str) -> str:
     """Return the stored sync-review status for *year_month*, defaulting to 'unknown'."""
+    return get_months_sync_status([year_month])[year_month]
+
+
+def get_months_sync_status(year_months: list[str]) -> dict[str, str]:
+    """Return {year_month: sync-review status} for every month in *year_months*, in one query."""
+    result = dict.fromkeys(year_months, MONTH_SYNC_UNKNOWN)
     try:
         _ensure_connected()
-        row = MonthSyncStatus.get_or_none(
-            (MonthSyncStatus.year_month == year_month) & (MonthSyncStatus.user_id == get_user_id())
+        rows = (
+            MonthSyncStatus.select(MonthSyncStatus.year_month, MonthSyncStatus.status)
+            .where((MonthSyncStatus.year_month.in_(year_months)) & (MonthSyncStatus.user_id == get_user_id()))
+            .tuples()
         )
-        return row.status if row else MONTH_SYNC_UNKNOWN
+        result.update(rows)
     except Exception as exc:
         print(f"[provider_status] failed to get month sync status: {exc}")
-        return MONTH_SYNC_UNKNOWN
+        return dict.fromkeys(year_months, MONTH_SYNC_UNKNOWN)
+    return result
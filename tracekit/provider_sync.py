@@ -23,7 +23,11 @@ class ProviderSync(Model):
 
     class Meta:
         database = db
-        indexes = ((("year_month", "provider", "user_id"), True),)  # unique together
+        indexes = (
+            (("year_month", "provider", "user_id"), True),  # unique together
+            # Covers the per-user provider/status rollup in tracekit.calendar.get_months_data.
+            (("user_id", "provider", "year_month", "status"), False),
+        )
 
     @classmethod
     def get_or_none(cls, year_month: str, provider: str) -> "ProviderSync":
@@ -0,0 +1,22 @@
+"""Provider name → activity model mapping shared by the query helpers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .file.file_activity import FileActivity
+from .garmin.garmin_activity import GarminActivity
+from .intervalsicu.intervalsicu_activity import IntervalsICUActivity
+from .ridewithgps.ridewithgps_activity import RideWithGPSActivity
+from .spreadsheet.spreadsheet_activity import SpreadsheetActivity
+from .strava.strava_activity import StravaActivity
+
+# Iteration order is the display order used when no priority is configured.
+PROVIDER_ACTIVITY_MODELS: dict[str, Any] = {
+    "strava": StravaActivity,
+    "garmin": GarminActivity,
+    "ridewithgps": RideWithGPSActivity,
+    "intervalsicu": IntervalsICUActivity,
+    "spreadsheet": SpreadsheetActivity,
+    "file": FileActivity,
+}
@@ -76,6 +76,9 @@ class BaseProviderActivity(Model):
     class Meta:
         database = db
         abstract = True  # This is a base class, not a concrete table
+        # Inherited by every provider table: the calendar and stats queries
+        # filter on user_id plus a start_time range.
+        indexes = ((("user_id", "start_time"), False),)
 
     def get_correlation_key(self) -> str:
         """Generate a correlation key for matching activities across providers.
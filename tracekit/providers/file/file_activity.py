@@ -25,7 +25,10 @@ class FileActivity(BaseProviderActivity):
     class Meta:
         database = db
         table_name = "file_activities"
-        indexes = ((("file_path", "file_checksum"), True),)  # Unique together
+        indexes = (
+            (("file_path", "file_checksum"), True),  # Unique together
+            *BaseProviderActivity._meta.indexes,
+        )
 
     @property
     def provider_id(self) -> str:
@@ -7,10 +7,21 @@ responsible for ensuring the database is initialised before calling these.
 
 from __future__ import annotations
 
+import contextlib
+import operator
 from datetime import UTC, datetime
+from functools import reduce
 from typing import Any
 from zoneinfo import ZoneInfo
 
+from peewee import SQL, SqliteDatabase, Value, fn
+
+from tracekit.database import get_all_models
+from tracekit.db import db
+from tracekit.providers.activities import PROVIDER_ACTIVITY_MODELS as _PROVIDER_MODELS
+from tracekit.user_context import get_user_id
+from tracekit.utils import get_timezone
+
 
 def _gear_corr_key(ts: int, dist: float) -> str:
     """Correlation key used by gear helpers: Eastern date + 0.5 mi bucket."""
@@ -24,49 +35,61 @@ def _gear_corr_key(ts: int, dist: float) -> str:
         return ""
 
 
-def _provider_model_map() -> dict[str, Any]:
-    """Return {provider_name: model_class} for all known providers."""
-    from tracekit.providers.file.file_activity import FileActivity
-    from tracekit.providers.garmin.garmin_activity import GarminActivity
-    from tracekit.providers.intervalsicu.intervalsicu_activity import (
-        IntervalsICUActivity,
+def get_provider_activity_counts() -> dict[str, int]:
+    """Return {provider_name: total_activity_count} for all known providers."""
+    uid = get_user_id()
+    # One UNION ALL round trip instead of a COUNT query per provider table.
+    query = reduce(
+        operator.add,
+        (
+            model.select(Value(name).alias("provider"), fn.COUNT(model.id).alias("n")).where(model.user_id == uid)
+            for name, model in _PROVIDER_MODELS.items()
+        ),
     )
-    from tracekit.providers.ridewithgps.ridewithgps_activity import RideWithGPSActivity
-    from tracekit.providers.spreadsheet.spreadsheet_activity import SpreadsheetActivity
-    from tracekit.providers.strava.strava_activity import StravaActivity
+    return dict(query.tuples())
 
-    return {
-        "strava": StravaActivity,
-        "garmin": GarminActivity,
-        "ridewithgps": RideWithGPSActivity,
-        "spreadsheet": SpreadsheetActivity,
-        "file": FileActivity,
-        "intervalsicu": IntervalsICUActivity,
-    }
 
+def get_activity_counts_by_user() -> dict[int, dict[str, int]]:
+    """Return {user_id: {provider_name: activity_count}} across every user.
 
-def get_provider_activity_counts() -> dict[str, int]:
-    """Return {provider_name: total_activity_count} for all known providers."""
-    from tracekit.providers.file.file_activity import FileActivity
-    from tracekit.providers.garmin.garmin_activity import GarminActivity
-    from tracekit.providers.intervalsicu.intervalsicu_activity import (
-        IntervalsICUActivity,
+    Providers a user has no activities for are omitted from their dict.
+    """
+    # One grouped UNION ALL instead of a COUNT query per provider and user.
+    query = reduce(
+        operator.add,
+        (
+            model.select(model.user_id, Value(name).alias("provider"), fn.COUNT(model.id).alias("n")).group_by(
+                model.user_id
+            )
+            for name, model in _PROVIDER_MODELS.items()
+        ),
     )
-    from tracekit.providers.ridewithgps.ridewithgps_activity import RideWithGPSActivity
-    from tracekit.providers.spreadsheet.spreadsheet_activity import SpreadsheetActivity
-    from tracekit.providers.strava.strava_activity import StravaActivity
-    from tracekit.user_context import get_user_id
-
-    models: dict[str, Any] = {
-        "strava": StravaActivity,
-        "garmin": GarminActivity,
-        "ridewithgps": RideWithGPSActivity,
-        "intervalsicu": IntervalsICUActivity,
-        "spreadsheet": SpreadsheetActivity,
-        "file": FileActivity,
-    }
+    counts: dict[int, dict[str, int]] = {}
+    for user_id, provider, n in query.tuples():
+        counts.setdefault(user_id, {})[provider] = n
+    return counts
+
+
+def _start_time_per_table(aggregate: Any) -> list[int]:
+    """Return *aggregate*(start_time) of each provider table for the current user.
+
+    Tables with no matching activity are left out.  All tables are read in one
+    UNION ALL round trip; if that fails (e.g. a provider table is missing),
+    each table is queried on its own so a broken table only drops itself.
+    """
     uid = get_user_id()
-    return {name: model.select().where(model.user_id == uid).count() for name, model in models.items()}
+    selects = [
+        model.select(aggregate(model.start_time).alias("ts")).where(model.user_id == uid)
+        for model in _PROVIDER_MODELS.values()
+    ]
+    try:
+        values = [ts for (ts,) in reduce(operator.add, selects).tuples()]
+    except Exception:
+        values = []
+        for select in selects:
+            with contextlib.suppress(Exception):
+                values.append(select.scalar())
+    return [int(ts) for ts in values if ts]
 
 
 def get_most_recent_activity(home_timezone: str = "UTC") -> dict[str, Any]:
@@ -78,94 +101,19 @@ def get_most_recent_activity(home_timezone: str = "UTC") -> dict[str, Any]:
     Returns:
         {"timestamp": int | None, "formatted": str | None}
     """
-    import pytz
-
-    from tracekit.providers.file.file_activity import FileActivity
-    from tracekit.providers.garmin.garmin_activity import GarminActivity
-    from tracekit.providers.intervalsicu.intervalsicu_activity import (
-        IntervalsICUActivity,
-    )
-    from tracekit.providers.ridewithgps.ridewithgps_activity import RideWithGPSActivity
-    from tracekit.providers.spreadsheet.spreadsheet_activity import SpreadsheetActivity
-    from tracekit.providers.strava.strava_activity import StravaActivity
-
-    models = [
-        StravaActivity,
-        GarminActivity,
-        RideWithGPSActivity,
-        IntervalsICUActivity,
-        SpreadsheetActivity,
-        FileActivity,
-    ]
-
-    from tracekit.user_context import get_user_id
-
-    uid = get_user_id()
-    max_ts: int | None = None
-    for model in models:
-        try:
-            row = (
-                model.select(model.start_time)
-                .where(model.start_time.is_null(False) & (model.user_id == uid))
-                .order_by(model.start_time.desc())
-                .first()
-            )
-            if row and row.start_time:
-                ts = int(row.start_time)
-                if max_ts is None or ts > max_ts:
-                    max_ts = ts
-        except Exception:
-            pass
+    max_ts = max(_start_time_per_table(fn.MAX), default=None)
 
     if max_ts is None:
         return {"timestamp": None, "formatted": None}
 
-    try:
-        tz = pytz.timezone(home_timezone)
-    except Exception:
-        tz = pytz.UTC
-
-    dt = datetime.fromtimestamp(max_ts, tz=UTC).astimezone(tz)
+    dt = datetime.fromtimestamp(max_ts, tz=UTC).astimezone(get_timezone(home_timezone))
     formatted = dt.strftime("%-d %b %Y, %H:%M %Z")
     return {"timestamp": max_ts, "formatted": formatted}
 
 
 def get_oldest_activity_month() -> str | None:
     """Return the earliest month with any activity as 'YYYY-MM', or None."""
-    from tracekit.providers.file.file_activity import FileActivity
-    from tracekit.providers.garmin.garmin_activity import GarminActivity
-    from tracekit.providers.intervalsicu.intervalsicu_activity import (
-        IntervalsICUActivity,
-    )
-    from tracekit.providers.ridewithgps.ridewithgps_activity import RideWithGPSActivity
-    from tracekit.providers.spreadsheet.spreadsheet_activity import SpreadsheetActivity
-    from tracekit.providers.strava.strava_activity import StravaActivity
-    from tracekit.user_context import get_user_id
-
-    models = [
-        StravaActivity,
-        GarminActivity,
-        RideWithGPSActivity,
-        IntervalsICUActivity,
-        SpreadsheetActivity,
-        FileActivity,
-    ]
-    uid = get_user_id()
-    min_ts: int | None = None
-    for model in models:
-        try:
-            row = (
-                model.select(model.start_time)
-                .where(model.start_time.is_null(False) & (model.user_id == uid))
-                .order_by(model.start_time.asc())
-                .first()
-            )
-            if row and row.start_time:
-                ts = int(row.start_time)
-                if min_ts is None or ts < min_ts:
-                    min_ts = ts
-        except Exception:
-            pass
+    min_ts = min(_start_time_per_table(fn.MIN), default=None)
 
     if min_ts is None:
         return None
@@ -182,36 +130,16 @@ def get_gear_summary(home_timezone: str = "UTC") -> list[dict[str, Any]]:
       - last_used: ISO date string of most recent activity (in home_timezone), or None
       - providers: {provider_name: distance_sum} for each provider
     """
-    from zoneinfo import ZoneInfo
-
-    from tracekit.providers.file.file_activity import FileActivity
-    from tracekit.providers.garmin.garmin_activity import GarminActivity
-    from tracekit.providers.intervalsicu.intervalsicu_activity import (
-        IntervalsICUActivity,
-    )
-    from tracekit.providers.ridewithgps.ridewithgps_activity import RideWithGPSActivity
-    from tracekit.providers.spreadsheet.spreadsheet_activity import SpreadsheetActivity
-    from tracekit.providers.strava.strava_activity import StravaActivity
-    from tracekit.user_context import get_user_id
-
     uid = get_user_id()
 
-    # Fixed provider list; ordering here doesn't affect correctness (dedup is per-gear).
-    all_providers: list[tuple[str, Any]] = [
-        ("strava", StravaActivity),
-        ("garmin", GarminActivity),
-        ("ridewithgps", RideWithGPSActivity),
-        ("spreadsheet", SpreadsheetActivity),
-        ("file", FileActivity),
-        ("intervalsicu", IntervalsICUActivity),
-    ]
-    provider_names = [p for p, _ in all_providers]
+    # Ordering here doesn't affect correctness (dedup is per-gear).
+    provider_names = list(_PROVIDER_MODELS)
 
     gear_map: dict[str, dict[str, Any]] = {}
     # Per-gear set of correlation keys already counted in the total (dedup).
     gear_seen: dict[str, set[str]] = {}
 
-    for provider_name, model_cls in all_providers:
+    for provider_name, model_cls in _PROVIDER_MODELS.items():
         try:
             rows = (
                 model_cls.select()
@@ -274,23 +202,19 @@ def get_gear_fix_months(
     discrepancy.  Falls back to the most recent month the yellow provider
     recorded this gear at all.
     """
-    from tracekit.user_context import get_user_id
-
     uid = get_user_id()
 
     result: dict[str, dict[str, str]] = {}
     if not gear_rows or not ordered_providers:
         return result
 
-    model_map = _provider_model_map()
-
     # Lazy-loaded per-provider cache: {corr_key: (equipment, "YYYY-MM")}
     provider_cache: dict[str, dict[str, tuple[str, str]]] = {}
 
     def _load(provider_name: str) -> dict[str, tuple[str, str]]:
         if provider_name in provider_cache:
             return provider_cache[provider_name]
-        model_cls = model_map.get(provider_name)
+        model_cls = _PROVIDER_MODELS.get(provider_name)
         if model_cls is None:
             provider_cache[provider_name] = {}
             return {}
@@ -374,14 +298,35 @@ def get_gear_fix_months(
 
 
 def get_database_info() -> dict[str, Any]:
-    """Return {table_name: row_count} for every model in the database."""
-    from tracekit.database import get_all_models
+    """Return {table_name: row_count} for every model in the database.
 
+    On PostgreSQL the counts are the planner's ``pg_class.reltuples``
+    estimates (kept current by autovacuum), read in one catalog query instead
+    of scanning every table.  Tables without a positive estimate (``0`` or
+    ``-1`` until first analysed, so a new database would otherwise report
+    empty tables), and all tables on SQLite, are counted exactly.
+    """
     models = get_all_models()
-    table_counts = {}
-    for model in models:
-        table_name = model._meta.table_name
-        table_counts[table_name] = model.select().count()
+    table_counts: dict[str, int] = {}
+    if not isinstance(db.obj, SqliteDatabase):
+        cursor = db.execute_sql(
+            "SELECT relname, reltuples::bigint FROM pg_class "
+            "WHERE relkind = 'r' AND pg_table_is_visible(oid) AND relname = ANY(%s)",
+            ([model._meta.table_name for model in models],),
+        )
+        table_counts = {name: n for name, n in cursor.fetchall() if n > 0}
+
+    # One UNION ALL round trip instead of a COUNT(*) query per table.
+    uncounted = [model for model in models if model._meta.table_name not in table_counts]
+    if uncounted:
+        query = reduce(
+            operator.add,
+            (
+                model.select(Value(model._meta.table_name).alias("table_name"), fn.COUNT(SQL("*")).alias("n"))
+                for model in uncounted
+            ),
+        )
+        table_counts.update(query.tuples())
 
     return {
         "tables": table_counts,
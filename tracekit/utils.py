@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
+import pytz
+
+
+@lru_cache(maxsize=64)
+def get_timezone(name: str) -> Any:
+    """Return the pytz timezone for *name*, falling back to UTC if unknown.
+
+    Memoised so hot paths that resolve the home timezone on every request
+    skip pytz's name normalisation and the exception path for bad values.
+    """
+    try:
+        return pytz.timezone(name)
+    except Exception:
+        return pytz.UTC
+
 
 def sort_providers(providers: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
     """Sort providers by priority (lowest number = highest priority).
 
     Enabled providers are sorted by their ``priority`` value; disabled
-    providers are appended at the end in arbitrary order.
+    providers are appended at the end in configuration order.
 
     Args:
         providers: Mapping of provider name → provider config dict.
@@ -17,14 +33,9 @@ def sort_providers(providers: dict[str, Any]) -> list[tuple[str, dict[str, Any]]
     Returns:
         Ordered list of (name, config) tuples.
     """
-    enabled: list[tuple[int, str, dict[str, Any]]] = []
-    disabled: list[tuple[str, dict[str, Any]]] = []
-    for name, cfg in providers.items():
-        if cfg.get("enabled", False):
-            enabled.append((cfg.get("priority", 999), name, cfg))
-        else:
-            disabled.append((name, cfg))
-    enabled.sort(key=lambda x: x[0])
-    result: list[tuple[str, dict[str, Any]]] = [(name, cfg) for _, name, cfg in enabled]
-    result.extend(disabled)
-    return result
+    # sorted() is stable: ties keep insertion order and disabled providers
+    # (all keyed alike) stay in the order they were configured.
+    return sorted(
+        providers.items(),
+        key=lambda item: (0, item[1].get("priority", 999)) if item[1].get("enabled", False) else (1, 0),
+    )